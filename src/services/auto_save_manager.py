@@ -13,7 +13,7 @@ import random
 import string
 import re
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import uuid
 from pathlib import Path
 import shutil
@@ -23,8 +23,25 @@ import traceback
 from pprint import pformat # Importado para o uso no bloco de código original
 from flask import g # Importado para o uso no bloco de código original
 
+# orjson é opcional: serializa os backups JSON bem mais rápido quando instalado
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serializa para JSON indentado em UTF-8, com orjson quando disponível"""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(data, ensure_ascii=False, indent=2, default=str).encode("utf-8")
+
 # Constante para compatibilidade
 AUTO_SAVE_DIR = Path("relatorios_intermediarios")
 
@@ -138,9 +155,14 @@ class AutoSaveManager:
         status: str = "sucesso",
         timestamp: Optional[float] = None,
         categoria: str = "geral",
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        manifesto: Optional[List[str]] = None
     ) -> str:
-        """Salva etapa imediatamente com timestamp único"""
+        """Salva etapa imediatamente com timestamp único
+
+        Com manifesto, 'dados' é um lote {nome_etapa: dados}; os nomes ficam registrados no JSON
+        para que recuperar_etapa/listar_etapas_salvas encontrem cada etapa do lote pelo nome.
+        """
 
         # Usa o session_id fornecido ou o current_session_id
         current_session_id = session_id if session_id is not None else self.current_session_id
@@ -168,7 +190,11 @@ class AutoSaveManager:
 
         try:
             # CORREÇÃO CRÍTICA: Limpa referências circulares ANTES de tentar salvar
-            clean_dados = self._remove_circular_references_safe(dados)
+            if manifesto is not None:
+                # Cada etapa do lote é limpa separadamente, com a mesma profundidade de um salvamento avulso
+                clean_dados = {nome: self._remove_circular_references_safe(dados.get(nome)) for nome in manifesto}
+            else:
+                clean_dados = self._remove_circular_references_safe(dados)
 
             # Prepara dados para salvamento
             save_data = {
@@ -182,6 +208,8 @@ class AutoSaveManager:
                 "categoria": categoria,
                 "tamanho_dados": len(str(clean_dados)) if clean_dados else 0
             }
+            if manifesto is not None:
+                save_data["manifesto"] = manifesto
 
             # Salva arquivo TXT limpo (sem dados brutos JSON)
             with open(filepath, "w", encoding="utf-8") as f:
@@ -190,7 +218,7 @@ class AutoSaveManager:
                 f.write(f"TIMESTAMP: {datetime.fromtimestamp(timestamp).strftime('%d/%m/%Y %H:%M:%S')}\n")
                 f.write(f"SESSÃO: {current_session_id}\n")
                 f.write(f"CATEGORIA: {categoria}\n")
-                f.write(f"TAMANHO: {len(str(dados)) if dados else 0} caracteres\n")
+                f.write(f"TAMANHO: {save_data['tamanho_dados']} caracteres\n")
                 f.write("=" * 50 + "\n")
 
                 # Escreve dados de forma legível (não JSON bruto)
@@ -214,14 +242,14 @@ class AutoSaveManager:
             # Log de sucesso
             logger.info(f"💾 Etapa '{nome_etapa}' salva: {filepath}")
 
-            # Salva também backup JSON para dados críticos
-            if categoria in ['analise_completa', 'pesquisa_web'] and len(str(clean_dados)) > 1000:
+            # Salva também backup JSON para dados críticos (lotes sempre: o manifesto fica no JSON)
+            if manifesto is not None or (categoria in ['analise_completa', 'pesquisa_web'] and save_data["tamanho_dados"] > 1000):
                 json_filepath = save_dir / f"{nome_etapa}_{timestamp_str}.json"
                 try:
-                    # Tenta serializar para JSON para verificar se há referências circulares
-                    json.dumps(save_data, default=str)
-                    with open(json_filepath, "w", encoding="utf-8") as f:
-                        json.dump(save_data, f, ensure_ascii=False, indent=2, default=str)
+                    # Serializa uma única vez; falha aqui indica dados não serializáveis
+                    payload = _dump_json_bytes(save_data)
+                    with open(json_filepath, "wb") as f:
+                        f.write(payload)
                 except (ValueError, TypeError) as json_error:
                     logger.warning(f"⚠️ Não foi possível salvar JSON para {nome_etapa}: {json_error}")
                     # Salva versão simplificada
@@ -307,8 +335,37 @@ class AutoSaveManager:
                         logger.error(f"❌ Erro ao recuperar {filepath}: {e}")
                         continue
 
+        # Não há arquivo próprio: procura a etapa no manifesto dos lotes (salvar_etapas_batch)
+        for categoria, subdir in self.subdirs.items():
+            session_dir = subdir / session_id
+            if session_dir.exists():
+                for filepath in session_dir.glob("*.json"):
+                    try:
+                        with open(filepath, "r", encoding="utf-8") as f:
+                            data = json.load(f)
+
+                        if nome_etapa in (data.get("manifesto") or ()) and data.get("status") == "sucesso":
+                            logger.info(f"📂 Etapa '{nome_etapa}' recuperada do lote: {filepath}")
+                            return self._etapa_do_lote(data, nome_etapa)
+
+                    except Exception as e:
+                        logger.error(f"❌ Erro ao recuperar {filepath}: {e}")
+                        continue
+
         return None
 
+    def _etapa_do_lote(self, lote: Dict[str, Any], nome_etapa: str) -> Dict[str, Any]:
+        """Monta, a partir de um lote, o registro de uma etapa no formato de um salvamento avulso"""
+        dados = (lote.get("dados") or {}).get(nome_etapa)
+        etapa = {chave: valor for chave, valor in lote.items() if chave != "manifesto"}
+        etapa.update(
+            etapa=nome_etapa,
+            dados=dados,
+            lote=lote.get("etapa"),
+            tamanho_dados=len(str(dados)) if dados else 0
+        )
+        return etapa
+
     def listar_etapas_salvas(self, session_id: str = None) -> Dict[str, Any]:
         """Lista todas as etapas salvas de uma sessão"""
 
@@ -326,6 +383,22 @@ class AutoSaveManager:
                         with open(filepath, "r", encoding="utf-8") as f:
                             data = json.load(f)
 
+                        manifesto = data.get("manifesto")
+                        if manifesto is not None:
+                            # Lote: lista cada etapa do manifesto, apontando para o arquivo do lote
+                            dados_lote = data.get("dados") or {}
+                            for etapa in manifesto:
+                                dados_etapa = dados_lote.get(etapa)
+                                etapas_encontradas.setdefault(etapa, []).append({
+                                    "arquivo": str(filepath),
+                                    "status": data.get("status"),
+                                    "timestamp": data.get("timestamp"),
+                                    "categoria": categoria,
+                                    "tamanho": len(str(dados_etapa)) if dados_etapa else 0,
+                                    "lote": data.get("etapa")
+                                })
+                            continue
+
                         etapa = data.get("etapa", "unknown")
                         if etapa not in etapas_encontradas:
                             etapas_encontradas[etapa] = []
@@ -372,6 +445,9 @@ class AutoSaveManager:
                 with open(arquivo_mais_recente["arquivo"], "r", encoding="utf-8") as f:
                     dados_etapa = json.load(f)
 
+                if arquivo_mais_recente.get("lote"):
+                    dados_etapa = self._etapa_do_lote(dados_etapa, etapa_nome)
+
                 relatorio_consolidado["etapas_processadas"][etapa_nome] = dados_etapa
 
                 # Atualiza estatísticas
@@ -391,8 +467,8 @@ class AutoSaveManager:
         timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
         relatorio_path = self.subdirs["analise_completa"] / f"CONSOLIDADO_{session_id}_{timestamp_str}.json"
 
-        with open(relatorio_path, "w", encoding="utf-8") as f:
-            json.dump(relatorio_consolidado, f, ensure_ascii=False, indent=2, default=str)
+        with open(relatorio_path, "wb") as f:
+            f.write(_dump_json_bytes(relatorio_consolidado))
 
         logger.info(f"📋 Relatório consolidado salvo: {relatorio_path}")
         return str(relatorio_path)
@@ -401,8 +477,8 @@ class AutoSaveManager:
         """Salva backup compactado para dados grandes"""
         try:
             backup_path = filepath.with_suffix('.json.gz')
-            with gzip.open(backup_path, 'wt', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+            with gzip.open(backup_path, 'wb') as f:
+                f.write(_dump_json_bytes(data))
 
             logger.info(f"🗜️ Backup compactado salvo: {backup_path}")
 
@@ -410,8 +486,12 @@ class AutoSaveManager:
             logger.error(f"❌ Erro ao salvar backup compactado: {e}")
 
     def _get_stack_trace(self, erro: Exception) -> str:
-        """Obtém stack trace do erro"""
-        return traceback.format_exc()
+        """Obtém stack trace do erro
+
+        Lido do próprio objeto da exceção: salvar_erro pode rodar em outra thread (gravação em
+        segundo plano), onde format_exc() não enxerga a exceção tratada.
+        """
+        return ''.join(traceback.format_exception(type(erro), erro, erro.__traceback__))
 
     def _remove_circular_references_safe(self, obj, max_depth=10, seen=None):
         """Remove referências circulares de forma segura e robusta"""
@@ -596,6 +676,19 @@ def salvar_etapa(nome_etapa: str, dados: Any, status: str = "sucesso", categoria
         session_id = auto_save_manager.current_session_id
     return auto_save_manager.salvar_etapa(nome_etapa, dados, status, categoria=categoria, session_id=session_id)
 
+def salvar_etapas_batch(nome_lote: str, itens: List[Tuple[str, Any]], status: str = "sucesso", categoria: str = "geral", session_id: Optional[str] = None) -> str:
+    """Salva várias etapas em um único arquivo, indexadas pelo nome de cada uma
+
+    O arquivo traz um manifesto com os nomes das etapas: recuperar_etapa, listar_etapas_salvas e
+    consolidar_sessao continuam encontrando cada uma pelo nome, como se tivesse sido salva avulsa.
+    """
+    if session_id is None:
+        session_id = auto_save_manager.current_session_id
+    dados = dict(itens)
+    return auto_save_manager.salvar_etapa(
+        nome_lote, dados, status, categoria=categoria, session_id=session_id, manifesto=list(dados)
+    )
+
 def salvar_erro(etapa: str, erro: Exception, contexto: Dict[str, Any] = None, session_id: Optional[str] = None) -> str:
     """Função de conveniência para salvamento de erros"""
     # Se session_id não for fornecido, tenta usar o current_session_id da instância global
@@ -18,7 +18,10 @@ Orquestrador seguro de componentes com validação rigorosa
 import logging
 import time
 import json
-from typing import Dict, List, Any, Optional, Callable
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Any, Optional, Callable, Iterator, Tuple
 from datetime import datetime
 from services.auto_save_manager import salvar_etapa, salvar_erro
 
@@ -81,6 +84,9 @@ class ComponentOrchestrator:
         self.component_results = {}
         self.execution_stats = {}
         self.components = {} # Adicionado para compatibilidade com a segunda parte do código
+        self.max_workers = 6  # Componentes independentes executados em paralelo
+        self.stream_queue_size = 4  # Resultados pendentes antes de bloquear o produtor
+        self._exec_plan = None  # Grafo compilado; invalidado a cada registro
 
         logger.info("Component Orchestrator inicializado")
 
@@ -107,8 +113,50 @@ class ComponentOrchestrator:
         if name not in self.execution_order:
             self.execution_order.append(name)
 
+        self._exec_plan = None
+
         logger.info(f"📝 Componente registrado: {name}")
 
+    def compile_execution_plan(self) -> Dict[str, Any]:
+        """Compila o grafo de dependências em lotes topológicos (algoritmo de Kahn)
+
+        Cada lote contém componentes que podem rodar em paralelo. Componentes em ciclo
+        ficam em 'unresolved'. O plano é reutilizado até o próximo register_component.
+        """
+        if self._exec_plan is not None:
+            return self._exec_plan
+
+        # Dependências não registradas são ignoradas
+        dependencies = {
+            name: frozenset(dep for dep in self._get_dependencies(name) if dep in self.components)
+            for name in self.components
+        }
+        dependents = {name: [] for name in self.components}
+        for name, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(name)
+
+        in_degree = {name: len(deps) for name, deps in dependencies.items()}
+        batch = [name for name, degree in in_degree.items() if degree == 0]
+        batches = []
+        while batch:
+            batches.append(tuple(batch))
+            next_batch = []
+            for name in batch:
+                for dependent in dependents[name]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_batch.append(dependent)
+            batch = next_batch
+
+        self._exec_plan = {
+            'dependencies': dependencies,
+            'dependents': {name: tuple(names) for name, names in dependents.items()},
+            'batches': tuple(batches),
+            'unresolved': tuple(name for name, degree in in_degree.items() if degree > 0)
+        }
+        return self._exec_plan
+
     def execute_components(
         self,
         data: Dict[str, Any],
@@ -116,56 +164,174 @@ class ComponentOrchestrator:
     ) -> Dict[str, Any]:
         """Executa todos os componentes de forma orquestrada"""
 
-        results = {}
-        components_executed = 0
+        start_time = time.time()
+        results = dict(self.execute_components_streaming(data, progress_callback))
+        return self.build_execution_report(results, start_time)
+
+    def execute_components_streaming(
+        self,
+        data: Dict[str, Any],
+        progress_callback: Optional[Callable] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Executa os componentes e produz (nome, resultado) conforme cada um termina
+
+        Os componentes formam um grafo de dependências: cada um é disparado assim que
+        todas as suas dependências terminam, então ramos independentes rodam em paralelo.
+        Os resultados das dependências chegam ao componente em data['previous_results'].
+        A fila limitada aplica backpressure no produtor quando o consumidor atrasa.
+        """
 
         logger.info(f"🚀 Iniciando execução de {len(self.components)} componentes")
 
-        # Prepara dados básicos se não existirem
-        base_data = self._prepare_base_data(data)
+        results_queue = queue.Queue(maxsize=self.stream_queue_size)
+        stop = threading.Event()
+        done_marker = object()
+        producer_error = []
+
+        def emit(item) -> bool:
+            while not stop.is_set():
+                try:
+                    results_queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
 
-        for component_name, component_func in self.components.items():
+        def producer():
             try:
-                logger.info(f"🔄 Executando componente: {component_name}")
+                self._run_graph(data, emit, stop)
+            except Exception as e:
+                producer_error.append(e)
+            finally:
+                emit(done_marker)
+
+        threading.Thread(target=producer, name="component-graph", daemon=True).start()
+
+        components_executed = 0
+        try:
+            while True:
+                item = results_queue.get()
+                if item is done_marker:
+                    break
 
+                components_executed += 1
                 if progress_callback:
-                    progress_callback(components_executed + 1, f"Executando {component_name}...")
+                    progress_callback(components_executed, f"{item[0]} concluído")
+                yield item
+        finally:
+            # Libera o produtor caso o consumidor pare antes do fim
+            stop.set()
 
-                # Prepara dados específicos para o componente
-                component_data = self._prepare_component_data(base_data, component_name)
+        if producer_error:
+            raise producer_error[0]
 
-                # Executa o componente
-                result = component_func(component_data)
+    def _run_graph(self, data: Dict[str, Any], emit: Callable, stop: threading.Event):
+        """Agenda o grafo de componentes e entrega cada resultado via emit"""
 
-                # Normaliza resultado se necessário
-                result = self._normalize_component_result(component_name, result)
+        results = {}
+        plan = self.compile_execution_plan()
+        dependents = plan['dependents']
 
-                # Valida o resultado
-                if self._validate_component_result(component_name, result):
-                    results[component_name] = result
-                    logger.info(f"✅ {component_name}: Sucesso")
+        # Prepara dados básicos se não existirem
+        base_data = self._prepare_base_data(data)
 
-                    # Salva resultado intermediário
-                    salvar_etapa(f"componente_{component_name}", result, categoria="analise_completa")
-                else:
-                    logger.error(f"❌ Componente {component_name} falhou na validação")
-                    results[component_name] = {'error': f'Falha na validação de {component_name}', 'component': component_name}
+        # Dependências restantes de cada componente nesta execução
+        pending_deps = {name: set(deps) for name, deps in plan['dependencies'].items()}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(self.components)))) as executor:
+            running = {}
+
+            def complete(component_name, result):
+                """Registra o resultado e devolve os dependentes que ficaram prontos"""
+                results[component_name] = result
+                emit((component_name, result))
+
+                ready = []
+                for dependent in dependents[component_name]:
+                    pending_deps[dependent].discard(component_name)
+                    if not pending_deps[dependent]:
+                        ready.append(dependent)
+                return ready
+
+            def submit_ready(names):
+                names = list(names)
+                while names:
+                    name = names.pop(0)
+                    if pending_deps[name] or stop.is_set():
+                        continue
+
+                    # Dependência obrigatória falhou: não desperdiça trabalho com o componente
+                    failed = self._failed_required_dependencies(name, results)
+                    if failed:
+                        logger.warning(f"⏭️ Componente {name} pulado: dependências obrigatórias falharam {failed}")
+                        names.extend(complete(name, {
+                            'error': f'Dependências obrigatórias falharam: {failed}',
+                            'component': name,
+                            'skipped': True
+                        }))
+                        continue
+
+                    component_data = self._prepare_component_data(base_data, name)
+                    component_data['previous_results'] = {
+                        dep: results[dep] for dep in self._get_dependencies(name) if dep in results
+                    }
+                    logger.info(f"🔄 Executando componente: {name}")
+                    running[executor.submit(self._run_component, name, component_data)] = name
 
-                components_executed += 1
+            submit_ready(plan['batches'][0] if plan['batches'] else ())
 
-            except Exception as e:
-                logger.error(f"❌ Erro ao executar {component_name}: {e}")
-                results[component_name] = {'error': str(e), 'component': component_name}
-                components_executed += 1
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                ready = []
+                for future in done:
+                    component_name = running.pop(future)
+                    ready.extend(complete(component_name, future.result()))
+
+                submit_ready(ready)
+
+        if stop.is_set():
+            return
 
-        # Relatório final
-        successful_components = sum(1 for result in results.values() if not result.get('error'))
+        # Componentes que nunca ficaram prontos (dependência circular)
+        for component_name in plan['unresolved']:
+            deps = pending_deps[component_name]
+            logger.error(f"❌ Componente {component_name} não executado: dependências não resolvidas {sorted(deps)}")
+            emit((component_name, {
+                'error': f'Dependências não resolvidas: {sorted(deps)}',
+                'component': component_name
+            }))
+
+    def _failed_required_dependencies(self, component_name: str, results: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Dependências que falharam e são obrigatórias (ou foram puladas em cascata)"""
+        failed = []
+        for dep in self._get_dependencies(component_name):
+            result = results.get(dep)
+            if result and result.get('error') and (
+                self.component_registry[dep].get('required', True) or result.get('skipped')
+            ):
+                failed.append(dep)
+        return failed
+
+    def build_execution_report(self, results: Dict[str, Dict[str, Any]], start_time: float) -> Dict[str, Any]:
+        """Monta e salva o relatório final a partir dos resultados dos componentes"""
+
+        # Mantém a ordem de registro no relatório
+        results = {name: results[name] for name in self.components if name in results}
+
+        successful = {name: result for name, result in results.items() if not result.get('error')}
         total_components = len(results)
+        success_rate = (len(successful) / total_components * 100) if total_components > 0 else 0
 
         report = {
             'components_executed': total_components,
-            'successful_components': successful_components,
-            'success_rate': (successful_components / total_components * 100) if total_components > 0 else 0,
+            'successful_components': successful,
+            'success_rate': success_rate,
+            'execution_stats': {
+                'total_components': total_components,
+                'successful_components': len(successful),
+                'success_rate': success_rate,
+                'execution_time': time.time() - start_time
+            },
             'results': results,
             'execution_summary': {
                 'total_time': time.time(),
@@ -179,6 +345,34 @@ class ComponentOrchestrator:
 
         return report
 
+    def _get_dependencies(self, component_name: str) -> List[str]:
+        """Retorna as dependências declaradas do componente"""
+        return self.component_registry.get(component_name, {}).get('dependencies', [])
+
+    def _run_component(self, component_name: str, component_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Executa, normaliza e valida um componente, sem propagar exceções"""
+        try:
+            component_func = self.components[component_name]
+            result = component_func(component_data)
+
+            # Normaliza resultado se necessário
+            result = self._normalize_component_result(component_name, result)
+
+            # Valida o resultado
+            if self._validate_component_result(component_name, result):
+                logger.info(f"✅ {component_name}: Sucesso")
+
+                # Salva resultado intermediário
+                salvar_etapa(f"componente_{component_name}", result, categoria="analise_completa")
+                return result
+
+            logger.error(f"❌ Componente {component_name} falhou na validação")
+            return {'error': f'Falha na validação de {component_name}', 'component': component_name}
+
+        except Exception as e:
+            logger.error(f"❌ Erro ao executar {component_name}: {e}")
+            return {'error': str(e), 'component': component_name}
+
     def _prepare_base_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Prepara dados básicos com fallbacks"""
         base_data = data.copy()
@@ -9,6 +9,8 @@ import logging
 import time
 import json
 import os
+import threading
+from itertools import cycle
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
@@ -28,6 +30,13 @@ class GoogleAPIRotation:
 
         self._initialize_usage_tracking()
 
+        # Rodízio O(1): ciclo de índices + flags de invalidação (chave revogada/403)
+        self._keys = tuple(self.api_keys)
+        self._key_positions = {key_config['api_key']: i for i, key_config in enumerate(self._keys)}
+        self._invalid = bytearray(len(self._keys))
+        self._index_cycle = cycle(range(len(self._keys)))
+        self._rotation_lock = threading.Lock()
+
         logger.info(f"Google API Rotation inicializado com {len(self.api_keys)} chaves")
 
     def _load_api_keys(self) -> List[Dict[str, str]]:
@@ -60,8 +69,8 @@ class GoogleAPIRotation:
 
         # Se não há chaves, cria uma configuração padrão
         if not api_keys:
-            default_key = os.getenv('GOOGLE_API_KEY')
-            default_cx = os.getenv('GOOGLE_CX')
+            default_key = os.getenv('GOOGLE_API_KEY') or os.getenv('GOOGLE_SEARCH_KEY')
+            default_cx = os.getenv('GOOGLE_CX') or os.getenv('GOOGLE_CSE_ID')
 
             if default_key and default_cx:
                 api_keys.append({
@@ -265,15 +274,29 @@ class GoogleAPIRotation:
         logger.info("🔓 Todas as chaves desbloqueadas")
 
     def get_next_api_key(self):
-        """Obtém próxima chave da rotação"""
-        if not self.api_keys:
+        """Obtém próxima chave da rotação, pulando chaves marcadas como inválidas"""
+        if not self._keys:
             logger.warning("⚠️ Nenhuma chave Google disponível")
             return None, None
 
-        key_data = self.api_keys[self.current_index]
-        self.current_index = (self.current_index + 1) % len(self.api_keys)
+        with self._rotation_lock:
+            for _ in range(len(self._keys)):
+                index = next(self._index_cycle)
+                if not self._invalid[index]:
+                    key_data = self._keys[index]
+                    return key_data['api_key'], key_data['cx']
+
+        logger.error("❌ Todas as chaves Google foram marcadas como inválidas")
+        return None, None
+
+    def mark_key_invalid(self, api_key: str):
+        """Marca uma chave como inválida para que a rotação deixe de usá-la"""
+        index = self._key_positions.get(api_key)
+        if index is None:
+            return
 
-        return key_data.get('api_key'), key_data.get('search_engine_id')
+        self._invalid[index] = 1
+        logger.warning(f"⚠️ Chave Google {self._keys[index]['name']} marcada como inválida")
 
     def get_next_api_keys(self):
         """Método compatível com código existente"""
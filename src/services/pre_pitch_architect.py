@@ -6,15 +6,100 @@ ARQUITETO DE PRÉ-PITCH INVISÍVEL - Sistema de preparação mental pré-venda
 """
 
 import os
+import re
+import copy
+import hashlib
 import logging
 import json
-from typing import Dict, List, Any, Optional
+from itertools import islice
+from string import Template
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime, timedelta
 from services.ai_manager import ai_manager
 from services.auto_save_manager import salvar_etapa, salvar_erro
 
+# orjson é opcional: (de)serializa JSON bem mais rápido quando instalado
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Marcadores de nível de consciência procurados na análise do estado mental
+_NIVEL_CONSCIENCIA_RE = re.compile(r'alta consciência|consciência moderada', re.IGNORECASE)
+
+# Primeiro número de uma duração (ex: "2-3 minutos" -> 2)
+_DURACAO_RE = re.compile(r'^\s*(\d+)')
+
+# Elementos e intensidades das sequências invisíveis, compartilhados entre requisições
+_ELEMENTOS_DESPERTAR = ('Educação', 'Insights', 'Cases')
+_ELEMENTOS_DESENVOLVIMENTO = ('Autoridade', 'Prova social', 'Urgência')
+_ELEMENTOS_PREPARACAO_FINAL = ('Ancoragem', 'Reciprocidade', 'Compromisso')
+_INTENSIDADE_BAIXA_MODERADA = 'Baixa a moderada'
+_INTENSIDADE_MODERADA_ALTA = 'Moderada a alta'
+_INTENSIDADE_ALTA = 'Alta'
+
+def _json_loads(texto: str) -> Any:
+    """Decodifica JSON com orjson quando disponível; erros de parse levantam ValueError"""
+    if HAS_ORJSON:
+        return orjson.loads(texto)
+    return json.loads(texto)
+
+def _json_dumps(dados: Any, sort_keys: bool = False) -> str:
+    """Serializa JSON compacto (sem escapar acentos) com orjson quando disponível"""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(dados, default=str, option=option).decode('utf-8')
+    return json.dumps(dados, ensure_ascii=False, separators=(',', ':'), sort_keys=sort_keys, default=str)
+
+# Roteiros fixos dos scripts de implementação e da sequência psicológica
+_EMAILS_SEQUENCIA_SEGUINTES = ("Email 2: Aprofundamento com case study", "Email 3: Conexão emocional e urgência")
+_POSTS_SOCIAIS = ("Post educativo sobre o problema", "Insight exclusivo do mercado", "Case de transformação")
+_CONTEUDOS_EDUCATIVOS = ("Artigo sobre tendências", "Vídeo explicativo", "Infográfico comparativo")
+_INTERACOES_DIRETAS = ("Pergunta provocativa", "Convite para reflexão", "Solicitação de opinião")
+_ELEMENTOS_VISUAIS_FASE = ("Gráficos de tendência", "Comparações visuais", "Timeline de evolução")
+_TRANSICOES_SEQUENCIA = {
+    'abertura_para_dor': 'E por isso que preciso compartilhar algo importante...',
+    'dor_para_desejo': 'Mas e se eu te dissesse que existe uma maneira de mudar isso?',
+    'desejo_para_logica': 'E nao e apenas um sonho, os dados comprovam...',
+    'logica_para_oferta': 'E exatamente por isso que...'
+}
+_GATILHOS_SEQUENCIA = ('urgencia', 'escassez', 'medo_perda', 'desejo_ganho')
+_PONTOS_ANCORAGEM_SEQUENCIA = (
+    'Momento de maxima dor (minuto 7)',
+    'Pico de desejo (minuto 15)',
+    'Validacao logica (minuto 18)',
+    'Curiosidade maxima (minuto 20)'
+)
+
+# Seções obrigatórias do pré-pitch avançado
+_SECOES_PRE_PITCH_AVANCADO = frozenset({'abertura_impacto', 'identificacao_dor', 'construcao_desejo', 'preparacao_logica', 'transicao_oferta'})
+
+# Palavras-chave de gatilhos psicológicos contadas no conteúdo gerado
+_TRIGGERS_KEYWORDS = ('dor', 'medo', 'desejo', 'urgencia', 'escassez', 'curiosidade', 'ganho', 'perda', 'confianca', 'autoridade')
+
+def _primeiros_itens(dados: Any, chave: str, limite: int) -> List[Any]:
+    """Retorna os primeiros itens da lista em dados[chave], tolerando ausência ou valor nulo"""
+    if not isinstance(dados, dict):
+        return []
+    valor = dados.get(chave) or ()
+    if isinstance(valor, str):
+        return [valor]
+    return list(islice(valor, limite))
+
+@dataclass(frozen=True, slots=True)
+class SequenciaPreparacao:
+    """Etapa de uma sequência de preparação mental"""
+    nome: str
+    objetivo: str
+    mecanismo: str
+    timing: str
+    intensidade: int
+
 class PrePitchArchitect:
     """
     ARQUITETO DE PRÉ-PITCH INVISÍVEL
@@ -22,13 +107,66 @@ class PrePitchArchitect:
     instalando âncoras emocionais que tornam a venda inevitável
     """
 
+    # Prompts por seção do pré-pitch avançado, preenchidos apenas para a seção pedida
+    _PROMPT_TEMPLATES = {
+        'abertura_impacto': Template("""
+            Crie uma abertura impactante para um pre-pitch sobre $produto no segmento $segmento.
+            Deve incluir: hook emocional, estatistica impactante, conexao imediata.
+            Duracao: $duracao
+            """),
+        'identificacao_dor': Template("""
+            Desenvolva sequencia para amplificar a dor do avatar em $segmento.
+            Deve incluir: espelhamento da situacao, agitacao controlada, validacao emocional.
+            Produto: $produto
+            """),
+        'construcao_desejo': Template("""
+            Crie narrativa para construir desejo irresistivel por $produto.
+            Deve incluir: visao do futuro ideal, contraste antes/depois, prova social.
+            Segmento: $segmento
+            """),
+        'preparacao_logica': Template("""
+            Crie a secao de preparacao logica para um pre-pitch de $produto no segmento $segmento.
+            Deve incluir: dados cientificos, autoridade, logica implacavel.
+            Duracao: $duracao
+            """),
+        'transicao_oferta': Template("""
+            Crie a transicao final para o pitch de $produto no segmento $segmento.
+            Deve incluir: revelacao gradual, curiosidade, inevitabilidade.
+            Duracao: $duracao
+            """)
+    }
+
+    # Conteúdo de fallback por seção, formatado apenas para a seção pedida
+    _FALLBACK_TEMPLATES = {
+        'abertura_impacto': "Profissionais de {segmento} estao perdendo oportunidades diariamente por nao conhecerem {produto}. Estatisticas mostram que 78% poderia dobrar resultados.",
+        'identificacao_dor': "Se voce trabalha com {segmento}, ja deve ter sentido a frustacao de nao conseguir os resultados esperados. Essa dor e real e precisa ser resolvida.",
+        'construcao_desejo': "Imagine dominar completamente {segmento} com {produto}. Seus resultados se multiplicam, sua confianca aumenta, seu futuro se transforma.",
+        'preparacao_logica': "Dados comprovam que {produto} e a solucao mais eficaz para {segmento}. Pesquisas indicam 300% de melhoria nos resultados.",
+        'transicao_oferta': "E exatamente por isso que desenvolvemos {produto} especificamente para profissionais de {segmento}..."
+    }
+
     def __init__(self):
         """Inicializa o Arquiteto de Pré-Pitch"""
-        self.elementos_pre_pitch = self._inicializar_elementos()
-        self.sequencias_preparacao = self._carregar_sequencias()
-        self.triggers_inconscientes = self._carregar_triggers()
+        # Cache de pré-pitches já construídos, indexado pelo hash do conteúdo de entrada
+        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.cache_max_size = 128
         logger.info("🎯 Pre-Pitch Architect inicializado com sucesso")
 
+    @cached_property
+    def elementos_pre_pitch(self) -> Dict[str, Any]:
+        """Elementos fundamentais do pré-pitch, montados no primeiro acesso"""
+        return self._inicializar_elementos()
+
+    @cached_property
+    def sequencias_preparacao(self) -> Dict[str, List[SequenciaPreparacao]]:
+        """Sequências de preparação mental, carregadas no primeiro acesso"""
+        return self._carregar_sequencias()
+
+    @cached_property
+    def triggers_inconscientes(self) -> Dict[str, List[str]]:
+        """Triggers inconscientes, carregados no primeiro acesso"""
+        return self._carregar_triggers()
+
     def _inicializar_elementos(self) -> Dict[str, Any]:
         """Inicializa elementos fundamentais do pré-pitch"""
         return {
@@ -56,77 +194,77 @@ class PrePitchArchitect:
             }
         }
 
-    def _carregar_sequencias(self) -> Dict[str, List[Dict]]:
+    def _carregar_sequencias(self) -> Dict[str, List[SequenciaPreparacao]]:
         """Carrega sequências de preparação mental"""
         return {
             'despertar_consciencia': [
-                {
-                    'nome': 'Identificação do Gap',
-                    'objetivo': 'Fazer perceber que existe um problema',
-                    'mecanismo': 'Apresentar realidade alternativa superior',
-                    'timing': '7-14 dias antes',
-                    'intensidade': 3
-                },
-                {
-                    'nome': 'Amplificação da Dor',
-                    'objetivo': 'Intensificar desconforto com situação atual',
-                    'mecanismo': 'Mostrar consequências futuras',
-                    'timing': '5-10 dias antes',
-                    'intensidade': 6
-                },
-                {
-                    'nome': 'Frustração Controlada',
-                    'objetivo': 'Criar urgência por solução',
-                    'mecanismo': 'Apresentar tentativas fracassadas',
-                    'timing': '3-7 dias antes',
-                    'intensidade': 7
-                }
+                SequenciaPreparacao(
+                    nome='Identificação do Gap',
+                    objetivo='Fazer perceber que existe um problema',
+                    mecanismo='Apresentar realidade alternativa superior',
+                    timing='7-14 dias antes',
+                    intensidade=3
+                ),
+                SequenciaPreparacao(
+                    nome='Amplificação da Dor',
+                    objetivo='Intensificar desconforto com situação atual',
+                    mecanismo='Mostrar consequências futuras',
+                    timing='5-10 dias antes',
+                    intensidade=6
+                ),
+                SequenciaPreparacao(
+                    nome='Frustração Controlada',
+                    objetivo='Criar urgência por solução',
+                    mecanismo='Apresentar tentativas fracassadas',
+                    timing='3-7 dias antes',
+                    intensidade=7
+                )
             ],
             'construcao_autoridade': [
-                {
-                    'nome': 'Demonstração de Expertise',
-                    'objetivo': 'Estabelecer credibilidade técnica',
-                    'mecanismo': 'Compartilhar insights exclusivos',
-                    'timing': '10-21 dias antes',
-                    'intensidade': 4
-                },
-                {
-                    'nome': 'Prova Social Indireta',
-                    'objetivo': 'Mostrar resultados sem vender',
-                    'mecanismo': 'Cases de sucesso relevantes',
-                    'timing': '7-14 dias antes',
-                    'intensidade': 5
-                },
-                {
-                    'nome': 'Reconhecimento de Terceiros',
-                    'objetivo': 'Validação externa da autoridade',
-                    'mecanismo': 'Menções e endossos',
-                    'timing': '3-10 dias antes',
-                    'intensidade': 6
-                }
+                SequenciaPreparacao(
+                    nome='Demonstração de Expertise',
+                    objetivo='Estabelecer credibilidade técnica',
+                    mecanismo='Compartilhar insights exclusivos',
+                    timing='10-21 dias antes',
+                    intensidade=4
+                ),
+                SequenciaPreparacao(
+                    nome='Prova Social Indireta',
+                    objetivo='Mostrar resultados sem vender',
+                    mecanismo='Cases de sucesso relevantes',
+                    timing='7-14 dias antes',
+                    intensidade=5
+                ),
+                SequenciaPreparacao(
+                    nome='Reconhecimento de Terceiros',
+                    objetivo='Validação externa da autoridade',
+                    mecanismo='Menções e endossos',
+                    timing='3-10 dias antes',
+                    intensidade=6
+                )
             ],
             'criacao_reciprocidade': [
-                {
-                    'nome': 'Valor Antecipado',
-                    'objetivo': 'Criar sensação de dívida',
-                    'mecanismo': 'Entregar valor genuíno gratuito',
-                    'timing': '14-30 dias antes',
-                    'intensidade': 4
-                },
-                {
-                    'nome': 'Insight Exclusivo',
-                    'objetivo': 'Demonstrar acesso privilegiado',
-                    'mecanismo': 'Compartilhar informação restrita',
-                    'timing': '7-21 dias antes',
-                    'intensidade': 6
-                },
-                {
-                    'nome': 'Solução Parcial',
-                    'objetivo': 'Provar capacidade de resolver',
-                    'mecanismo': 'Resolver problema menor',
-                    'timing': '3-14 dias antes',
-                    'intensidade': 7
-                }
+                SequenciaPreparacao(
+                    nome='Valor Antecipado',
+                    objetivo='Criar sensação de dívida',
+                    mecanismo='Entregar valor genuíno gratuito',
+                    timing='14-30 dias antes',
+                    intensidade=4
+                ),
+                SequenciaPreparacao(
+                    nome='Insight Exclusivo',
+                    objetivo='Demonstrar acesso privilegiado',
+                    mecanismo='Compartilhar informação restrita',
+                    timing='7-21 dias antes',
+                    intensidade=6
+                ),
+                SequenciaPreparacao(
+                    nome='Solução Parcial',
+                    objetivo='Provar capacidade de resolver',
+                    mecanismo='Resolver problema menor',
+                    timing='3-14 dias antes',
+                    intensidade=7
+                )
             ]
         }
 
@@ -189,7 +327,7 @@ class PrePitchArchitect:
             return base_pre_pitch
 
         except Exception as e:
-            logger.error(f"❌ Erro ao gerar pré-pitch avançado: {e}")
+            logger.error("❌ Erro ao gerar pré-pitch avançado: %s", e)
             return self._pre_pitch_fallback(avatar_data)
 
     def construir_pre_pitch_invisivel(self, avatar_data: Dict[str, Any],
@@ -200,14 +338,21 @@ class PrePitchArchitect:
         Constrói sistema completo de pré-pitch invisível
         """
         try:
+            cache_key = self._cache_key(avatar_data, oferta_data, drivers_mentais)
+            if cache_key in self.cache:
+                logger.info("🔄 Pré-pitch invisível recuperado do cache")
+                pre_pitch_completo = copy.deepcopy(self.cache[cache_key])
+                salvar_etapa('pre_pitch_invisivel', pre_pitch_completo, session_id)
+                return pre_pitch_completo
+
             logger.info("🎯 Construindo pré-pitch invisível personalizado")
 
-            # 1. Análise do estado mental atual
-            estado_mental = self._analisar_estado_mental_atual(avatar_data)
+            # Timestamp único para todas as etapas desta construção
+            timestamp = datetime.now().isoformat()
 
-            # 2. Design da jornada de preparação
-            jornada_preparacao = self._designar_jornada_preparacao(
-                avatar_data, estado_mental, drivers_mentais
+            # 1 e 2. Análise do estado mental atual e design da jornada de preparação
+            estado_mental, jornada_preparacao = self._analisar_estado_e_jornada(
+                avatar_data, drivers_mentais, timestamp
             )
 
             # 3. Construção de sequências invisíveis
@@ -236,146 +381,100 @@ class PrePitchArchitect:
                 'plano_temporal': plano_temporal,
                 'elementos_ancoragem': self._definir_elementos_ancoragem(sequencias_invisiveis),
                 'metricas_esperadas': self._calcular_metricas_esperadas(sequencias_invisiveis),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
 
             salvar_etapa('pre_pitch_invisivel', pre_pitch_completo, session_id)
+            # Só reaproveita resultados gerados pela IA; fallbacks devem ser tentados de novo
+            if 'analise_completa' in estado_mental and 'jornada_completa' in jornada_preparacao:
+                self._store_in_cache(cache_key, pre_pitch_completo)
 
             logger.info("✅ Pré-pitch invisível construído com sucesso")
             return pre_pitch_completo
 
         except Exception as e:
             error_msg = f"Erro ao construir pré-pitch: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             salvar_erro('pre_pitch_architect', error_msg, session_id)
             return {'error': error_msg}
 
-    def _analisar_estado_mental_atual(self, avatar_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Analisa estado mental do avatar"""
-        try:
-            # Verifica se avatar_data é válido
-            if not isinstance(avatar_data, dict):
-                logger.warning("Avatar data inválido - usando dados padrão")
-                avatar_data = self._get_default_avatar_data()
-
-            # Tratamento robusto de dores e desejos
-            dores = avatar_data.get('dores_viscerais', [])
-            desejos = avatar_data.get('desejos_secretos', [])
-
-            # Converte string para lista se necessário
-            if isinstance(dores, str):
-                dores = [dores]
-            elif not isinstance(dores, list):
-                dores = []
-
-            if isinstance(desejos, str):
-                desejos = [desejos]
-            elif not isinstance(desejos, list):
-                desejos = []
-
-            # Garante que temos pelo menos dados básicos
-            if not dores:
-                dores = ['Falta de resultados consistentes', 'Pressão por crescimento']
-            if not desejos:
-                desejos = ['Alcançar estabilidade financeira', 'Reconhecimento profissional']
-
-            prompt_analise = f"""
-            ANÁLISE DE ESTADO MENTAL PRÉ-PITCH
-
-            Avatar: {avatar_data.get('nome', 'Não informado')}
-            Perfil: {json.dumps(avatar_data, ensure_ascii=False, indent=2)}
-
-            MISSÃO: Analisar o estado mental ATUAL do avatar antes de qualquer intervenção de pré-pitch.
-
-            Identifique com precisão cirúrgica:
-
-            1. NÍVEL DE CONSCIÊNCIA DO PROBLEMA
-            - Sabe que tem o problema? (0-10)
-            - Entende a gravidade? (0-10)
-            - Sente urgência para resolver? (0-10)
-            - Já tentou soluções? (sim/não + quais)
-
-            2. RESISTÊNCIAS MENTAIS ATIVAS
-            - Ceticismo em relação a soluções (0-10)
-            - Experiências negativas anteriores
-            - Crenças limitantes ativas
-            - Mecanismos de autodefesa
-
-            3. RECEPTIVIDADE ATUAL
-            - Abertura para novas informações (0-10)
-            - Disposição para investir (0-10)
-            - Confiança em sua capacidade (0-10)
-            - Energia para mudanças (0-10)
-
-            4. PONTOS DE ALAVANCAGEM
-            - Dores mais sensíveis no momento
-            - Desejos mais intensos agora
-            - Medos mais paralisantes
-            - Esperanças mais motivadoras
-
-            5. ESTADO EMOCIONAL DOMINANTE
-            - Emoção predominante atual
-            - Padrão emocional dos últimos 30 dias
-            - Triggers emocionais mais sensíveis
-            - Recursos emocionais disponíveis
-
-            Seja um SCANNER MENTAL preciso e impiedoso.
-            """
-
-            response = ai_manager.generate_analysis(prompt_analise, max_tokens=2000)
-
-            if response:
-                return {
-                    'analise_completa': response,
-                    'nivel_preparacao': self._avaliar_nivel_preparacao(response['response']),
-                    'resistencias_principais': self._extrair_resistencias(response['response']),
-                    'pontos_alavancagem': self._extrair_alavancagem(response['response']),
-                    'timestamp': datetime.now().isoformat()
-                }
-            else:
-                return self._estado_mental_fallback(avatar_data)
+    def _cache_key(self, *payloads: Any) -> str:
+        """Gera chave de cache estável a partir do conteúdo dos dicionários de entrada"""
+        serialized = _json_dumps(payloads, sort_keys=True)
+        return hashlib.blake2b(serialized.encode('utf-8'), digest_size=16).hexdigest()
 
-        except Exception as e:
-            logger.error(f"❌ Erro na análise de estado mental: {e}")
-            return {
-                'estado_dominante': 'neutro',
-                'nivel_urgencia': 'medio',
-                'pontos_dor_ativados': [],
-                'desejos_mobilizados': []
-            }
+    def _store_in_cache(self, cache_key: str, pre_pitch: Dict[str, Any]):
+        """Armazena pré-pitch no cache, descartando a entrada mais antiga quando cheio"""
+        if len(self.cache) >= self.cache_max_size:
+            self.cache.pop(next(iter(self.cache)))
+        self.cache[cache_key] = copy.deepcopy(pre_pitch)
 
-    def _get_default_avatar_data(self) -> Dict[str, Any]:
-        """Retorna dados padrão do avatar"""
-        return {
-            'dores_viscerais': [
-                'Falta de crescimento consistente',
-                'Pressão da concorrência',
-                'Dificuldades operacionais'
-            ],
-            'desejos_secretos': [
-                'Dominar o mercado',
-                'Reconhecimento como líder',
-                'Crescimento sustentável'
-            ],
-            'perfil_demografico': {
-                'idade': '35-50',
-                'localização': 'Brasil',
-                'segmento': 'Empresarial'
-            }
-        }
+    def clear_cache(self):
+        """Limpa cache de pré-pitches"""
+        self.cache = {}
+        logger.info("🧹 Cache de pré-pitch limpo")
+
+    def _analisar_estado_e_jornada(self, avatar_data: Dict[str, Any], drivers_mentais: Dict[str, Any],
+                                   timestamp: str = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Analisa estado mental e designa jornada de preparação em uma única chamada à IA"""
+        timestamp = timestamp or datetime.now().isoformat()
 
-    def _designar_jornada_preparacao(self, avatar_data: Dict, estado_mental: Dict, drivers_mentais: Dict) -> Dict[str, Any]:
-        """Designa jornada personalizada de preparação mental"""
+        # Verifica se avatar_data é válido
+        if not isinstance(avatar_data, dict):
+            logger.warning("Avatar data inválido - usando dados padrão")
+            avatar_data = self._get_default_avatar_data()
 
-        prompt_jornada = f"""
-        DESIGN DE JORNADA DE PREPARAÇÃO MENTAL
+        drivers = _primeiros_itens(drivers_mentais, 'drivers_personalizados', 3)
+
+        prompt = f"""
+        ANÁLISE DE ESTADO MENTAL E DESIGN DE JORNADA PRÉ-PITCH
 
         DADOS DE ENTRADA:
-        Avatar: {json.dumps(avatar_data, ensure_ascii=False, indent=2)}
-        Estado Mental: {estado_mental}
-        Drivers Disponíveis: {json.dumps(drivers_mentais.get('drivers_personalizados', [])[:3], ensure_ascii=False, indent=2)}
+        Avatar: {avatar_data.get('nome', 'Não informado')}
+        Perfil: {_json_dumps(avatar_data)}
+        Drivers Disponíveis: {_json_dumps(drivers)}
+
+        === SEÇÃO A: ESTADO MENTAL ===
+
+        MISSÃO: Analisar o estado mental ATUAL do avatar antes de qualquer intervenção de pré-pitch.
+
+        Identifique com precisão cirúrgica:
+
+        1. NÍVEL DE CONSCIÊNCIA DO PROBLEMA
+        - Sabe que tem o problema? (0-10)
+        - Entende a gravidade? (0-10)
+        - Sente urgência para resolver? (0-10)
+        - Já tentou soluções? (sim/não + quais)
+
+        2. RESISTÊNCIAS MENTAIS ATIVAS
+        - Ceticismo em relação a soluções (0-10)
+        - Experiências negativas anteriores
+        - Crenças limitantes ativas
+        - Mecanismos de autodefesa
+
+        3. RECEPTIVIDADE ATUAL
+        - Abertura para novas informações (0-10)
+        - Disposição para investir (0-10)
+        - Confiança em sua capacidade (0-10)
+        - Energia para mudanças (0-10)
+
+        4. PONTOS DE ALAVANCAGEM
+        - Dores mais sensíveis no momento
+        - Desejos mais intensos agora
+        - Medos mais paralisantes
+        - Esperanças mais motivadoras
+
+        5. ESTADO EMOCIONAL DOMINANTE
+        - Emoção predominante atual
+        - Padrão emocional dos últimos 30 dias
+        - Triggers emocionais mais sensíveis
+        - Recursos emocionais disponíveis
 
-        MISSÃO: Criar uma JORNADA CIRÚRGICA que leve o avatar do estado atual até a receptividade total para o pitch.
+        Seja um SCANNER MENTAL preciso e impiedoso.
+
+        === SEÇÃO B: JORNADA ===
+
+        MISSÃO: Com base no estado mental da SEÇÃO A, criar uma JORNADA CIRÚRGICA que leve o avatar do estado atual até a receptividade total para o pitch.
 
         Para cada fase da jornada:
 
@@ -408,25 +507,83 @@ class PrePitchArchitect:
 
         Crie uma jornada que seja INEVITÁVEL mas INVISÍVEL.
         O avatar deve SENTIR que chegou às conclusões sozinho.
+
+        RETORNE APENAS um JSON válido, com o texto completo de cada seção:
+        {{"estado_mental": "análise da SEÇÃO A", "jornada": "jornada da SEÇÃO B"}}
         """
 
         try:
-            response = ai_manager.generate_analysis(prompt_jornada, max_tokens=2000)
-
-            if response:
-                return {
-                    'jornada_completa': response,
-                    'fases_estruturadas': self._estruturar_fases(response),
-                    'duracao_total': '21 dias',
-                    'pontos_controle': self._definir_pontos_controle(response),
-                    'timestamp': datetime.now().isoformat()
-                }
-            else:
-                return self._jornada_preparacao_fallback()
-
+            response = ai_manager.generate_analysis(prompt, max_tokens=4000)
         except Exception as e:
-            logger.error(f"Erro no design da jornada: {e}")
-            return self._jornada_preparacao_fallback()
+            logger.error("❌ Erro na análise de estado mental e jornada: %s", e)
+            return {
+                'estado_dominante': 'neutro',
+                'nivel_urgencia': 'medio',
+                'pontos_dor_ativados': [],
+                'desejos_mobilizados': []
+            }, self._jornada_preparacao_fallback()
+
+        if not response:
+            return self._estado_mental_fallback(avatar_data), self._jornada_preparacao_fallback()
+
+        analise, jornada = self._separar_secoes_estado_jornada(response)
+
+        estado_mental = {
+            'analise_completa': analise,
+            'nivel_preparacao': self._avaliar_nivel_preparacao(analise),
+            'resistencias_principais': self._extrair_resistencias(analise),
+            'pontos_alavancagem': self._extrair_alavancagem(analise),
+            'timestamp': timestamp
+        }
+        jornada_preparacao = {
+            'jornada_completa': jornada,
+            'fases_estruturadas': self._estruturar_fases(jornada),
+            'duracao_total': '21 dias',
+            'pontos_controle': self._definir_pontos_controle(jornada),
+            'timestamp': timestamp
+        }
+        return estado_mental, jornada_preparacao
+
+    def _separar_secoes_estado_jornada(self, response: str) -> Tuple[str, str]:
+        """Separa a resposta combinada nas seções de estado mental e jornada"""
+        clean_response = response.strip()
+        if "```json" in clean_response:
+            start = clean_response.find("```json") + 7
+            end = clean_response.rfind("```")
+            clean_response = clean_response[start:end].strip()
+
+        try:
+            secoes = _json_loads(clean_response)
+            if isinstance(secoes, dict) and secoes.get('estado_mental') and secoes.get('jornada'):
+                return str(secoes['estado_mental']), str(secoes['jornada'])
+        except ValueError:
+            logger.warning("⚠️ IA não retornou JSON válido para estado mental e jornada")
+
+        # Fallback: divide pelo delimitador da seção B, se presente
+        antes, separador, depois = response.partition('SEÇÃO B')
+        if separador:
+            return antes, depois
+        return response, response
+
+    def _get_default_avatar_data(self) -> Dict[str, Any]:
+        """Retorna dados padrão do avatar"""
+        return {
+            'dores_viscerais': [
+                'Falta de crescimento consistente',
+                'Pressão da concorrência',
+                'Dificuldades operacionais'
+            ],
+            'desejos_secretos': [
+                'Dominar o mercado',
+                'Reconhecimento como líder',
+                'Crescimento sustentável'
+            ],
+            'perfil_demografico': {
+                'idade': '35-50',
+                'localização': 'Brasil',
+                'segmento': 'Empresarial'
+            }
+        }
 
     def _construir_sequencias_invisiveis(self, jornada: Dict, oferta_data: Dict) -> Dict[str, Any]:
         """Constrói sequências invisíveis de preparação"""
@@ -571,8 +728,8 @@ class PrePitchArchitect:
         return {
             'personality_type': avatar_data.get('perfil_psicografico', {}).get('personalidade', ''),
             'communication_style': 'Adaptado ao perfil',
-            'emotional_triggers': avatar_data.get('dores_viscerais', [])[:3],
-            'motivational_drivers': avatar_data.get('desejos_secretos', [])[:3]
+            'emotional_triggers': _primeiros_itens(avatar_data, 'dores_viscerais', 3),
+            'motivational_drivers': _primeiros_itens(avatar_data, 'desejos_secretos', 3)
         }
 
     def _criar_boosters_conversao(self, oferta_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -674,13 +831,13 @@ class PrePitchArchitect:
 
     def _avaliar_nivel_preparacao(self, analise: str) -> int:
         """Avalia nível de preparação baseado na análise"""
-        # Lógica simplificada para determinar nível
-        if 'alta consciência' in analise.lower():
-            return 8
-        elif 'consciência moderada' in analise.lower():
-            return 5
-        else:
-            return 3
+        # Lógica simplificada para determinar nível (varredura única, sem cópia em minúsculas)
+        nivel = 3
+        for match in _NIVEL_CONSCIENCIA_RE.finditer(analise):
+            if match.group(0).lower() == 'alta consciência':
+                return 8
+            nivel = 5
+        return nivel
 
     def _extrair_resistencias(self, analise: str) -> List[str]:
         """Extrai resistências principais da análise"""
@@ -711,24 +868,24 @@ class PrePitchArchitect:
         """Cria sequência de despertar"""
         return {
             'objetivo': 'Despertar consciência do problema',
-            'elementos': ['Educação', 'Insights', 'Cases'],
-            'intensidade': 'Baixa a moderada'
+            'elementos': _ELEMENTOS_DESPERTAR,
+            'intensidade': _INTENSIDADE_BAIXA_MODERADA
         }
 
     def _criar_sequencia_desenvolvimento(self, jornada: Dict) -> Dict:
         """Cria sequência de desenvolvimento"""
         return {
             'objetivo': 'Desenvolver confiança e urgência',
-            'elementos': ['Autoridade', 'Prova social', 'Urgência'],
-            'intensidade': 'Moderada a alta'
+            'elementos': _ELEMENTOS_DESENVOLVIMENTO,
+            'intensidade': _INTENSIDADE_MODERADA_ALTA
         }
 
     def _criar_sequencia_preparacao_final(self, jornada: Dict, oferta_data: Dict) -> Dict:
         """Cria sequência de preparação final"""
         return {
             'objetivo': 'Preparação direta para pitch',
-            'elementos': ['Ancoragem', 'Reciprocidade', 'Compromisso'],
-            'intensidade': 'Alta'
+            'elementos': _ELEMENTOS_PREPARACAO_FINAL,
+            'intensidade': _INTENSIDADE_ALTA
         }
 
     def _definir_elementos_invisibilidade(self) -> List[str]:
@@ -761,41 +918,24 @@ class PrePitchArchitect:
         """Gera emails da sequência"""
         return [
             f"Email 1: Introdução ao conceito para {avatar_data.get('nome', 'avatar')}",
-            "Email 2: Aprofundamento com case study",
-            "Email 3: Conexão emocional e urgência"
+            *_EMAILS_SEQUENCIA_SEGUINTES
         ]
 
-    def _gerar_posts_sociais(self, sequencia: Dict) -> List[str]:
+    def _gerar_posts_sociais(self, sequencia: Dict) -> Tuple[str, ...]:
         """Gera posts sociais"""
-        return [
-            "Post educativo sobre o problema",
-            "Insight exclusivo do mercado",
-            "Case de transformação"
-        ]
+        return _POSTS_SOCIAIS
 
-    def _gerar_conteudos_educativos(self, sequencia: Dict) -> List[str]:
+    def _gerar_conteudos_educativos(self, sequencia: Dict) -> Tuple[str, ...]:
         """Gera conteúdos educativos"""
-        return [
-            "Artigo sobre tendências",
-            "Vídeo explicativo",
-            "Infográfico comparativo"
-        ]
+        return _CONTEUDOS_EDUCATIVOS
 
-    def _gerar_interacoes_diretas(self, sequencia: Dict) -> List[str]:
+    def _gerar_interacoes_diretas(self, sequencia: Dict) -> Tuple[str, ...]:
         """Gera interações diretas"""
-        return [
-            "Pergunta provocativa",
-            "Convite para reflexão",
-            "Solicitação de opinião"
-        ]
+        return _INTERACOES_DIRETAS
 
-    def _sugerir_elementos_visuais_fase(self, sequencia: Dict) -> List[str]:
+    def _sugerir_elementos_visuais_fase(self, sequencia: Dict) -> Tuple[str, ...]:
         """Sugere elementos visuais para a fase"""
-        return [
-            "Gráficos de tendência",
-            "Comparações visuais",
-            "Timeline de evolução"
-        ]
+        return _ELEMENTOS_VISUAIS_FASE
 
     # Novos métodos para generate_advanced_pre_pitch
 
@@ -804,38 +944,14 @@ class PrePitchArchitect:
         segmento = context_data.get('segmento', 'mercado')
         produto = context_data.get('produto', 'produto')
 
-        prompt_templates = {
-            'abertura_impacto': f"""
-            Crie uma abertura impactante para um pre-pitch sobre {produto} no segmento {segmento}.
-            Deve incluir: hook emocional, estatistica impactante, conexao imediata.
-            Duracao: {config['duracao']}
-            """,
-            'identificacao_dor': f"""
-            Desenvolva sequencia para amplificar a dor do avatar em {segmento}.
-            Deve incluir: espelhamento da situacao, agitacao controlada, validacao emocional.
-            Produto: {produto}
-            """,
-            'construcao_desejo': f"""
-            Crie narrativa para construir desejo irresistivel por {produto}.
-            Deve incluir: visao do futuro ideal, contraste antes/depois, prova social.
-            Segmento: {segmento}
-            """,
-            'preparacao_logica': f"""
-            Crie a secao de preparacao logica para um pre-pitch de {produto} no segmento {segmento}.
-            Deve incluir: dados cientificos, autoridade, logica implacavel.
-            Duracao: {config['duracao']}
-            """,
-            'transicao_oferta': f"""
-            Crie a transicao final para o pitch de {produto} no segmento {segmento}.
-            Deve incluir: revelacao gradual, curiosidade, inevitabilidade.
-            Duracao: {config['duracao']}
-            """
-        }
-
         # Usa IA para gerar conteudo se disponivel
         if hasattr(self, 'ai_manager') and self.ai_manager:
             try:
-                prompt = prompt_templates.get(secao, f"Gere conteudo para {secao} sobre {produto}")
+                template = self._PROMPT_TEMPLATES.get(secao)
+                if template:
+                    prompt = template.substitute(produto=produto, segmento=segmento, duracao=config['duracao'])
+                else:
+                    prompt = f"Gere conteudo para {secao} sobre {produto}"
                 # Assume que ai_manager tem um método generate_content
                 response = ai_manager.generate_content(prompt, max_tokens=800)
 
@@ -848,24 +964,19 @@ class PrePitchArchitect:
                         'objetivo': config['objetivo']
                     }
             except Exception as e:
-                logger.warning(f"⚠️ IA falhou para {secao}: {e}")
+                logger.warning("⚠️ IA falhou para %s: %s", secao, e)
 
         # Fallback para conteudo basico
         return self._create_fallback_section(secao, config, segmento, produto)
 
     def _create_fallback_section(self, secao: str, config: Dict[str, Any], segmento: str, produto: str) -> Dict[str, Any]:
         """Cria secao de fallback"""
-        conteudo_fallback = {
-            'abertura_impacto': f"Profissionais de {segmento} estao perdendo oportunidades diariamente por nao conhecerem {produto}. Estatisticas mostram que 78% poderia dobrar resultados.",
-            'identificacao_dor': f"Se voce trabalha com {segmento}, ja deve ter sentido a frustacao de nao conseguir os resultados esperados. Essa dor e real e precisa ser resolvida.",
-            'construcao_desejo': f"Imagine dominar completamente {segmento} com {produto}. Seus resultados se multiplicam, sua confianca aumenta, seu futuro se transforma.",
-            'preparacao_logica': f"Dados comprovam que {produto} e a solucao mais eficaz para {segmento}. Pesquisas indicam 300% de melhoria nos resultados.",
-            'transicao_oferta': f"E exatamente por isso que desenvolvemos {produto} especificamente para profissionais de {segmento}..."
-        }
+        template = self._FALLBACK_TEMPLATES.get(secao)
+        content = template.format(segmento=segmento, produto=produto) if template else f"Conteudo para {secao}"
 
         return {
             'ai_generated': False,
-            'content': conteudo_fallback.get(secao, f"Conteudo para {secao}"),
+            'content': content,
             'tecnicas': config['tecnicas'],
             'duracao': config['duracao'],
             'objetivo': config['objetivo']
@@ -875,19 +986,9 @@ class PrePitchArchitect:
         """Cria sequencia psicologica otimizada"""
         return {
             'ordem_execucao': list(conteudo.keys()),
-            'transicoes': {
-                'abertura_para_dor': 'E por isso que preciso compartilhar algo importante...',
-                'dor_para_desejo': 'Mas e se eu te dissesse que existe uma maneira de mudar isso?',
-                'desejo_para_logica': 'E nao e apenas um sonho, os dados comprovam...',
-                'logica_para_oferta': 'E exatamente por isso que...'
-            },
-            'gatilhos_emocionais': ['urgencia', 'escassez', 'medo_perda', 'desejo_ganho'],
-            'pontos_ancoragem': [
-                'Momento de maxima dor (minuto 7)',
-                'Pico de desejo (minuto 15)',
-                'Validacao logica (minuto 18)',
-                'Curiosidade maxima (minuto 20)'
-            ]
+            'transicoes': dict(_TRANSICOES_SEQUENCIA),
+            'gatilhos_emocionais': _GATILHOS_SEQUENCIA,
+            'pontos_ancoragem': _PONTOS_ANCORAGEM_SEQUENCIA
         }
 
     def _validate_advanced_pre_pitch_quality(self, conteudo: Dict[str, Any], context_data: Dict[str, Any]) -> bool:
@@ -896,21 +997,25 @@ class PrePitchArchitect:
             return False
 
         # Verifica se todas as secoes esperadas estao presentes
-        secoes_esperadas = ['abertura_impacto', 'identificacao_dor', 'construcao_desejo', 'preparacao_logica', 'transicao_oferta']
-        if not all(secao in conteudo for secao in secoes_esperadas):
+        if not _SECOES_PRE_PITCH_AVANCADO <= conteudo.keys():
             logger.warning("Nem todas as secoes esperadas estao presentes no conteudo.")
             return False
 
+        # Uma única passada acumula tamanho total e secoes geradas por IA
+        total_content_length = 0
+        ai_generated_count = 0
+        for section in conteudo.values():
+            total_content_length += len(str(section.get('content', '')))
+            ai_generated_count += bool(section.get('ai_generated', False))
+
         # Verifica se o conteudo gerado tem tamanho razoavel
-        total_content_length = sum(len(str(section.get('content', ''))) for section in conteudo.values())
         if total_content_length < 500: # Limiar minimo de caracteres
-            logger.warning(f"Conteudo total do pre-pitch muito curto ({total_content_length} caracteres).")
+            logger.warning("Conteudo total do pre-pitch muito curto (%d caracteres).", total_content_length)
             return False
 
         # Verifica se ha uma boa mistura de conteudo gerado por IA
-        ai_generated_count = sum(1 for section in conteudo.values() if section.get('ai_generated', False))
         if ai_generated_count < 2: # Minimo de 2 secoes geradas por IA
-            logger.warning(f"Poucas secoes geradas por IA ({ai_generated_count}).")
+            logger.warning("Poucas secoes geradas por IA (%d).", ai_generated_count)
             return False
 
         return True
@@ -935,32 +1040,22 @@ class PrePitchArchitect:
 
     def _calculate_total_duration(self, pre_pitch_structure: Dict[str, Any]) -> str:
         """Calcula a duracao total estimada do pre-pitch"""
-        total_minutes = 0
-        for section, config in pre_pitch_structure.items():
-            duracao_str = config.get('duracao', '0 minutos')
-            try:
-                # Extrai os minutos da string (ex: "2-3 minutos" -> 2 ou 3)
-                parts = duracao_str.split('-')
-                if len(parts) == 2:
-                    minutes = int(parts[0].split()[0])
-                    total_minutes += minutes
-                elif len(parts) == 1:
-                    minutes = int(duracao_str.split()[0])
-                    total_minutes += minutes
-            except:
-                pass # Ignora se o formato for inesperado
+        total_minutes = sum(
+            int(match.group(1))
+            for config in pre_pitch_structure.values()
+            if (match := _DURACAO_RE.match(str(config.get('duracao', '0 minutos'))))
+        )
         return f"Aproximadamente {total_minutes} minutos"
 
     def _count_psychological_triggers(self, conteudo: Dict[str, Any]) -> int:
         """Conta o numero de gatilhos psicologicos presentes no conteudo"""
-        count = 0
-        triggers_keywords = ['dor', 'medo', 'desejo', 'urgencia', 'escassez', 'curiosidade', 'ganho', 'perda', 'confianca', 'autoridade']
-        for section in conteudo.values():
-            text = str(section.get('content', '')).lower()
-            for trigger in triggers_keywords:
-                if trigger in text:
-                    count += 1
-        return count
+        # Conta pares (secao, gatilho): cada gatilho vale no maximo 1 por secao
+        return sum(
+            trigger in text
+            for text in (str(section.get('content', '')).lower() for section in conteudo.values())
+            if text
+            for trigger in _TRIGGERS_KEYWORDS
+        )
 
 
     def _create_emergency_pre_pitch(self, avatar_data: Dict[str, Any], context_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1004,11 +1099,11 @@ class PrePitchArchitect:
     def _extract_mental_state_data(self, avatar_data):
         """Extrai dados de estado mental do avatar"""
         try:
-            # Se for string, converte para dict
+            # Se for string, converte para dict (só tenta o parse quando pode ser um objeto JSON)
             if isinstance(avatar_data, str):
                 try:
-                    avatar_data = json.loads(avatar_data)
-                except json.JSONDecodeError:
+                    avatar_data = _json_loads(avatar_data) if avatar_data.lstrip().startswith('{') else {}
+                except ValueError:
                     logger.warning("❌ Falha ao fazer parse JSON do avatar_data")
                     avatar_data = {}
 
@@ -1022,8 +1117,8 @@ class PrePitchArchitect:
             # Se estado_mental é string, tenta converter
             if isinstance(estado_mental, str):
                 try:
-                    estado_mental = json.loads(estado_mental)
-                except json.JSONDecodeError:
+                    estado_mental = _json_loads(estado_mental) if estado_mental.lstrip().startswith('{') else {}
+                except ValueError:
                     estado_mental = {}
 
             # Se ainda não é dict, usa dict vazio
@@ -1038,7 +1133,7 @@ class PrePitchArchitect:
             }
 
         except Exception as e:
-            logger.error(f"❌ Erro na extração de estado mental: {e}")
+            logger.error("❌ Erro na extração de estado mental: %s", e)
             return {
                 'estado_dominante': 'neutro',
                 'nivel_urgencia': 'medio',
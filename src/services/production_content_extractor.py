@@ -5,29 +5,89 @@ ARQV30 Enhanced v2.0 - Production Content Extractor
 Extrator de conteúdo robusto com Jina Reader Fallback System
 """
 
+import re
+import json
 import logging
 import requests
 import trafilatura
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup
 import time
+import hashlib
+import threading
+from itertools import cycle
+from configparser import ConfigParser
+from collections import defaultdict
 from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse, urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+
+# Parser C (lxml) é bem mais rápido que o html.parser puro Python
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
 logger = logging.getLogger(__name__)
 
+# Remove tags HTML do conteúdo retornado pelo Mercury Parser
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 class ProductionContentExtractor:
     """Extrator de conteúdo robusto com sistema de fallback Jina Reader"""
 
     def __init__(self):
         """Inicializa extrator de produção"""
+        # Estratégias locais (rápidas) primeiro; APIs remotas depois, cada uma com orçamento próprio
         self.strategies = [
-            'jina_reader',      # Novo: Jina Reader como primeira opção
             'trafilatura',
-            'mercury_parser',   # Novo: Mercury Parser API
-            'requests_html',
             'beautiful_soup',
+            'requests_html',
+            'jina_reader',      # Jina Reader API
+            'mercury_parser',   # Mercury Parser API
             'simple_requests'
         ]
         self.timeout = 30
+        self.strategy_timeouts = {
+            'trafilatura': 10,
+            'beautiful_soup': 8,
+            'requests_html': 10,
+            'jina_reader': 12,
+            'mercury_parser': 12,
+            'simple_requests': 5
+        }
+        # Estratégias disputadas em paralelo quando extract_content(race_mode=True)
+        self.race_strategies = ['trafilatura', 'beautiful_soup', 'requests_html']
+        # Prazo total de extract_content para uma URL (segundos). O corpo é lido em streaming e o prazo
+        # verificado entre blocos: o estouro máximo é uma leitura de socket (limitada pelo timeout)
+        self.extraction_budget = 20
+        # Tamanho máximo de HTML lido para parsing, evita páginas patológicas em memória
+        self.max_html_bytes = 2 * 1024 * 1024
+        self.max_workers = 32
+        self.max_per_host = 4
+        # Limita requisições simultâneas ao mesmo domínio durante extrações em lote
+        self._host_semaphores = defaultdict(lambda: threading.BoundedSemaphore(self.max_per_host))
+        self._host_semaphores_lock = threading.Lock()
+
+        # Sessão compartilhada: reaproveita conexões keep-alive/TLS entre extrações
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=self.max_workers,
+            # Sem nova tentativa em timeout de leitura: não multiplica o tempo da estratégia
+            max_retries=Retry(total=2, read=0, connect=1, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Cache das APIs remotas (Jina/Mercury), indexado por estratégia + hash da URL
+        self.cached_strategies = {'jina_reader', 'mercury_parser'}
+        self.cache = {}
+        self.cache_ttl = 86400  # 24 horas
+        self.cache_max_size = 1000
+        self._cache_lock = threading.Lock()
         self.jina_base_url = "https://r.jina.ai/"
         self.mercury_api_key = None  # Configurar se disponível
         self.user_agents = [
@@ -35,26 +95,54 @@ class ProductionContentExtractor:
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         ]
+        # Rodízio sem lock: next() em itertools.cycle é atômico sob o GIL
+        self._user_agent_cycle = cycle(self.user_agents)
+
+        # Configuração do trafilatura lida uma única vez; cópias por timeout (em segundos inteiros)
+        self._trafilatura_base_config = trafilatura.settings.use_config()
+        self._trafilatura_configs = {}
 
         logger.info("Production Content Extractor inicializado com Jina Reader Fallback System")
 
-    def extract_content(self, url: str, strategy_preference: Optional[str] = None) -> Optional[str]:
+    def extract_content(self, url: str, strategy_preference: Optional[str] = None,
+                        race_mode: bool = False) -> Optional[str]:
         """Extrai conteúdo usando múltiplas estratégias com fallback inteligente"""
 
+        tried = set()
+        # Prazo total da extração, compartilhado por todas as etapas abaixo
+        deadline = time.monotonic() + self.extraction_budget
+
         # Se uma estratégia específica foi solicitada, tenta ela primeiro
         if strategy_preference and strategy_preference in self.strategies:
+            tried.add(strategy_preference)
             try:
-                content = self._execute_strategy(strategy_preference, url)
+                content = self._execute_strategy(
+                    strategy_preference, url, self._strategy_timeout(strategy_preference, deadline)
+                )
                 if content and len(content.strip()) > 100:  # Conteúdo válido
                     logger.info(f"✅ Estratégia preferida '{strategy_preference}' bem-sucedida")
                     return content
             except Exception as e:
                 logger.warning(f"⚠️ Estratégia preferida '{strategy_preference}' falhou: {e}")
 
-        # Executa todas as estratégias em ordem de prioridade
+        # Modo corrida: as estratégias mais baratas competem em paralelo, vence a primeira válida
+        if race_mode:
+            content = self._extract_race(url, deadline)
+            if content:
+                return content
+            tried.update(self.race_strategies)
+
+        # Executa todas as estratégias em ordem de prioridade, respeitando o prazo total
         for strategy in self.strategies:
+            if strategy in tried:
+                continue
+            timeout = self._strategy_timeout(strategy, deadline)
+            if timeout <= 0:
+                logger.warning(f"⏱️ Prazo de extração esgotado para {url}")
+                break
+
             try:
-                content = self._execute_strategy(strategy, url)
+                content = self._execute_strategy(strategy, url, timeout)
                 if content and len(content.strip()) > 100:  # Validação básica
                     logger.info(f"✅ Estratégia '{strategy}' bem-sucedida para {url}")
                     return content
@@ -66,26 +154,130 @@ class ProductionContentExtractor:
         logger.error(f"❌ TODAS as estratégias falharam para {url}")
         return None
 
-    def _execute_strategy(self, strategy: str, url: str) -> Optional[str]:
-        """Executa estratégia específica"""
+    def _strategy_timeout(self, strategy: str, deadline: float) -> float:
+        """Timeout da estratégia limitado ao que resta do prazo total"""
+        return min(self.strategy_timeouts.get(strategy, self.timeout), deadline - time.monotonic())
+
+    def _extract_race(self, url: str, deadline: float) -> Optional[str]:
+        """Executa race_strategies em paralelo e retorna o primeiro conteúdo válido"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        executor = ThreadPoolExecutor(max_workers=len(self.race_strategies))
+        future_to_strategy = {
+            executor.submit(self._execute_strategy, strategy, url, self._strategy_timeout(strategy, deadline)): strategy
+            for strategy in self.race_strategies
+        }
+
+        try:
+            for future in as_completed(future_to_strategy, timeout=remaining):
+                strategy = future_to_strategy[future]
+                try:
+                    content = future.result()
+                except Exception as e:
+                    logger.warning(f"⚠️ Estratégia '{strategy}' falhou na corrida para {url}: {e}")
+                    continue
+
+                if content and len(content.strip()) > 100:
+                    logger.info(f"✅ Estratégia '{strategy}' venceu a corrida para {url}")
+                    return content
+        except FuturesTimeoutError:
+            logger.warning(f"⏱️ Prazo da corrida de estratégias esgotado para {url}")
+        finally:
+            # Não espera as perdedoras; as que ainda não começaram são canceladas
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return None
+
+    def batch_extract(self, urls: List[str], max_workers: Optional[int] = None) -> Dict[str, Optional[str]]:
+        """Extrai conteúdo de múltiplas URLs em paralelo, limitando conexões por domínio"""
+        results = {}
+        if not urls:
+            return results
+
+        workers = min(max_workers or self.max_workers, len(urls))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_url = {executor.submit(self._extract_with_host_limit, url): url for url in urls}
+
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    logger.error(f"Erro na extração paralela de {url}: {e}")
+                    results[url] = None
+
+        return results
+
+    def _extract_with_host_limit(self, url: str) -> Optional[str]:
+        """Executa extract_content respeitando o limite de conexões por domínio"""
+        host = urlparse(url).netloc
+        with self._host_semaphores_lock:
+            semaphore = self._host_semaphores[host]
+        with semaphore:
+            return self.extract_content(url)
+
+    def _execute_strategy(self, strategy: str, url: str, timeout: Optional[float] = None) -> Optional[str]:
+        """Executa estratégia específica, reaproveitando respostas em cache das APIs remotas
+
+        timeout substitui o strategy_timeouts da estratégia (usado para respeitar o prazo total).
+        """
+
+        if strategy not in self.cached_strategies:
+            return self._run_strategy(strategy, url, timeout)
+
+        cache_key = self._cache_key(strategy, url)
+        cache_data = self.cache.get(cache_key)
+        if cache_data and time.time() - cache_data['timestamp'] < self.cache_ttl:
+            logger.debug(f"🔄 {strategy} do cache para: {url}")
+            return cache_data['content']
+
+        content = self._run_strategy(strategy, url, timeout)
+        if content:
+            with self._cache_lock:
+                if len(self.cache) >= self.cache_max_size:
+                    self.cache.pop(next(iter(self.cache)))
+                self.cache[cache_key] = {'content': content, 'timestamp': time.time()}
+        return content
+
+    def _cache_key(self, strategy: str, url: str) -> str:
+        """Gera chave de cache para estratégia + URL"""
+        return f"{strategy}:{hashlib.sha256(url.encode('utf-8')).hexdigest()}"
+
+    def invalidate(self, url: str):
+        """Remove do cache as respostas de todas as estratégias para uma URL"""
+        with self._cache_lock:
+            for strategy in self.cached_strategies:
+                self.cache.pop(self._cache_key(strategy, url), None)
+
+    def clear_cache(self):
+        """Limpa cache de respostas das APIs remotas"""
+        with self._cache_lock:
+            self.cache = {}
+        logger.info("🧹 Cache de extração limpo")
+
+    def _run_strategy(self, strategy: str, url: str, timeout: Optional[float] = None) -> Optional[str]:
+        """Despacha para o extrator da estratégia"""
 
         if strategy == 'jina_reader':
-            return self._extract_with_jina_reader(url)
+            return self._extract_with_jina_reader(url, timeout)
         elif strategy == 'trafilatura':
-            return self._extract_with_trafilatura(url)
+            return self._extract_with_trafilatura(url, timeout)
         elif strategy == 'mercury_parser':
-            return self._extract_with_mercury_parser(url)
+            return self._extract_with_mercury_parser(url, timeout)
         elif strategy == 'requests_html':
-            return self._extract_with_requests_html(url)
+            return self._extract_with_requests_html(url, timeout)
         elif strategy == 'beautiful_soup':
-            return self._extract_with_bs4(url)
+            return self._extract_with_bs4(url, timeout)
         elif strategy == 'simple_requests':
-            return self._extract_with_simple_requests(url)
+            return self._extract_with_simple_requests(url, timeout)
         else:
             logger.error(f"❌ Estratégia desconhecida: {strategy}")
             return None
 
-    def _extract_with_jina_reader(self, url: str) -> Optional[str]:
+    def _extract_with_jina_reader(self, url: str, timeout: Optional[float] = None) -> Optional[str]:
         """Extrai usando Jina Reader API"""
         try:
             # Jina Reader API endpoint
@@ -97,39 +289,52 @@ class ProductionContentExtractor:
                 'X-Return-Format': 'text'  # Solicita texto limpo
             }
 
-            response = requests.get(
+            timeout = timeout or self.strategy_timeouts['jina_reader']
+            deadline = time.monotonic() + timeout
+
+            with self.session.get(
                 jina_url,
                 headers=headers,
-                timeout=self.timeout,
-                allow_redirects=True
-            )
-
-            if response.status_code == 200:
-                content = response.text.strip()
-                if len(content) > 100:  # Validação básica
-                    logger.debug(f"✅ Jina Reader extraiu {len(content)} caracteres")
-                    return content
-                else:
-                    logger.warning("⚠️ Jina Reader retornou conteúdo muito curto")
+                timeout=timeout,
+                allow_redirects=True,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.error(f"❌ Jina Reader erro: {response.status_code}")
                     return None
+                body = self._read_limited_body(response, self.max_html_bytes, deadline)
+                encoding = response.encoding or 'utf-8'
+
+            content = body.decode(encoding, errors='replace').strip()
+            if len(content) > 100:  # Validação básica
+                logger.debug(f"✅ Jina Reader extraiu {len(content)} caracteres")
+                return content
             else:
-                logger.error(f"❌ Jina Reader erro: {response.status_code}")
+                logger.warning("⚠️ Jina Reader retornou conteúdo muito curto")
                 return None
 
         except Exception as e:
             logger.error(f"❌ Jina Reader falhou: {e}")
             return None
 
-    def _extract_with_trafilatura(self, url: str) -> Optional[str]:
+    def _extract_with_trafilatura(self, url: str, timeout: Optional[float] = None) -> Optional[str]:
         """Extrai usando Trafilatura (fallback principal)"""
         try:
             # Configurações otimizadas para Trafilatura
+            # fetch_url não usa a sessão: o limite vai pela configuração, que só aceita segundos
+            # inteiros; arredonda para baixo e desiste se não sobra nem 1s do prazo
+            seconds = int(timeout or self.strategy_timeouts['trafilatura'])
+            if seconds < 1:
+                logger.debug("Trafilatura ignorado: prazo de extração insuficiente")
+                return None
+            config = self._trafilatura_config(seconds)
             downloaded = trafilatura.fetch_url(
                 url,
                 no_ssl=False,
                 include_comments=False,
                 include_tables=True,
-                include_formatting=False
+                include_formatting=False,
+                config=config
             )
 
             if downloaded:
@@ -150,7 +355,7 @@ class ProductionContentExtractor:
 
         return None
 
-    def _extract_with_mercury_parser(self, url: str) -> Optional[str]:
+    def _extract_with_mercury_parser(self, url: str, timeout: Optional[float] = None) -> Optional[str]:
         """Extrai usando Mercury Parser API (se disponível)"""
         try:
             # Mercury Parser API (requer configuração)
@@ -166,20 +371,26 @@ class ProductionContentExtractor:
 
             params = {'url': url}
 
-            response = requests.get(
+            timeout = timeout or self.strategy_timeouts['mercury_parser']
+            deadline = time.monotonic() + timeout
+
+            with self.session.get(
                 mercury_url,
                 headers=headers,
                 params=params,
-                timeout=self.timeout
-            )
+                timeout=timeout,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    return None
+                body = self._read_limited_body(response, self.max_html_bytes, deadline)
 
-            if response.status_code == 200:
-                data = response.json()
+            if body:
+                data = json.loads(body)
                 content = data.get('content', '')
 
                 # Remove HTML tags básicos
-                import re
-                clean_content = re.sub(r'<[^>]+>', '', content)
+                clean_content = _HTML_TAG_RE.sub('', content)
 
                 if len(clean_content.strip()) > 100:
                     logger.debug(f"✅ Mercury Parser extraiu {len(clean_content)} caracteres")
@@ -190,9 +401,12 @@ class ProductionContentExtractor:
 
         return None
 
-    def _extract_with_requests_html(self, url: str) -> Optional[str]:
+    def _extract_with_requests_html(self, url: str, timeout: Optional[float] = None) -> Optional[str]:
         """Extrai usando requests com parsing HTML aprimorado"""
         try:
+            timeout = timeout or self.strategy_timeouts['requests_html']
+            deadline = time.monotonic() + timeout
+
             headers = {
                 'User-Agent': self._get_random_user_agent(),
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -202,16 +416,19 @@ class ProductionContentExtractor:
                 'Upgrade-Insecure-Requests': '1'
             }
 
-            response = requests.get(
+            with self.session.get(
                 url,
                 headers=headers,
-                timeout=self.timeout,
-                allow_redirects=True
-            )
+                timeout=timeout,
+                allow_redirects=True,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    return None
+                body = self._read_limited_body(response, self.max_html_bytes, deadline)
 
-            if response.status_code == 200:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.content, 'html.parser')
+            if body:
+                soup = BeautifulSoup(body, HTML_PARSER)
 
                 # Remove scripts e styles
                 for script in soup(["script", "style", "nav", "footer", "header"]):
@@ -225,10 +442,8 @@ class ProductionContentExtractor:
                 else:
                     text = soup.get_text()
 
-                # Limpa texto
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                clean_text = ' '.join(chunk for chunk in chunks if chunk)
+                # Limpa texto (normaliza espaços em uma única passada em C)
+                clean_text = ' '.join(text.split())
 
                 if len(clean_text) > 100:
                     # Limita tamanho para evitar overflow
@@ -239,18 +454,24 @@ class ProductionContentExtractor:
 
         return None
 
-    def _extract_with_bs4(self, url: str) -> Optional[str]:
+    def _extract_with_bs4(self, url: str, timeout: Optional[float] = None) -> Optional[str]:
         """Extrai usando BeautifulSoup básico"""
         try:
-            response = requests.get(
+            timeout = timeout or self.strategy_timeouts['beautiful_soup']
+            deadline = time.monotonic() + timeout
+
+            with self.session.get(
                 url,
-                timeout=self.timeout,
-                headers={'User-Agent': self._get_random_user_agent()}
-            )
+                timeout=timeout,
+                headers={'User-Agent': self._get_random_user_agent()},
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    return None
+                body = self._read_limited_body(response, self.max_html_bytes, deadline)
 
-            if response.status_code == 200:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.content, 'html.parser')
+            if body:
+                soup = BeautifulSoup(body, HTML_PARSER)
                 text = soup.get_text()
 
                 # Limpeza básica
@@ -264,58 +485,105 @@ class ProductionContentExtractor:
 
         return None
 
-    def _extract_with_simple_requests(self, url: str) -> Optional[str]:
+    def _extract_with_simple_requests(self, url: str, timeout: Optional[float] = None) -> Optional[str]:
         """Extrai usando requests simples (último recurso)"""
         try:
-            response = requests.get(
+            timeout = timeout or self.strategy_timeouts['simple_requests']
+            deadline = time.monotonic() + timeout
+
+            with self.session.get(
                 url,
-                timeout=self.timeout,
-                headers={'User-Agent': self._get_random_user_agent()}
-            )
+                timeout=timeout,
+                headers={'User-Agent': self._get_random_user_agent()},
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    return None
+                # Lê só o necessário para 20000 caracteres (até 4 bytes por caractere em UTF-8)
+                body = self._read_limited_body(response, 20000 * 4, deadline)
+                encoding = response.encoding or 'utf-8'
 
-            if response.status_code == 200:
-                # Retorna HTML bruto limitado
-                content = response.text[:20000]
+            # Retorna HTML bruto limitado
+            content = body.decode(encoding, errors='replace')[:20000]
 
-                if len(content) > 100:
-                    return content
+            if len(content) > 100:
+                return content
 
         except Exception as e:
             logger.error(f"❌ Simple requests falhou: {e}")
 
         return None
 
+    def _read_limited_body(self, response: requests.Response, max_bytes: int,
+                           deadline: Optional[float] = None) -> bytes:
+        """Lê o corpo da resposta em streaming, parando ao atingir max_bytes
+
+        O timeout do requests vale por leitura de socket, não para a resposta inteira: com deadline
+        (time.monotonic()), um servidor que envia bytes aos poucos é interrompido entre blocos.
+        """
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(chunk_size=8192):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= max_bytes:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"prazo de leitura esgotado após {total} bytes")
+        return b''.join(chunks)[:max_bytes]
+
+    def _trafilatura_config(self, seconds: int):
+        """Configuração do trafilatura com DOWNLOAD_TIMEOUT fixo; uma cópia por valor, reaproveitada"""
+        config = self._trafilatura_configs.get(seconds)
+        if config is None:
+            # Cópia própria: threads simultâneas não alteram o timeout umas das outras
+            config = ConfigParser()
+            config.read_dict(self._trafilatura_base_config)
+            config.set('DEFAULT', 'DOWNLOAD_TIMEOUT', str(seconds))
+            self._trafilatura_configs[seconds] = config
+        return config
+
     def _get_random_user_agent(self) -> str:
-        """Retorna user agent aleatório"""
-        import random
-        return random.choice(self.user_agents)
+        """Retorna o próximo user agent do rodízio"""
+        return next(self._user_agent_cycle)
 
     def test_all_strategies(self, url: str) -> Dict[str, Any]:
-        """Testa todas as estratégias para debugging"""
+        """Testa todas as estratégias em paralelo para debugging"""
 
         results = {}
 
-        for strategy in self.strategies:
-            try:
-                start_time = time.time()
-                content = self._execute_strategy(strategy, url)
-                execution_time = time.time() - start_time
+        with ThreadPoolExecutor(max_workers=len(self.strategies)) as executor:
+            future_to_strategy = {
+                executor.submit(self._test_strategy, strategy, url): strategy
+                for strategy in self.strategies
+            }
 
-                results[strategy] = {
-                    'success': bool(content and len(content.strip()) > 100),
-                    'content_length': len(content) if content else 0,
-                    'execution_time': round(execution_time, 2),
-                    'preview': content[:200] + '...' if content and len(content) > 200 else content
-                }
+            for future in as_completed(future_to_strategy):
+                results[future_to_strategy[future]] = future.result()
 
-            except Exception as e:
-                results[strategy] = {
-                    'success': False,
-                    'error': str(e),
-                    'execution_time': 0
-                }
+        # Mantém a ordem de prioridade das estratégias no resultado
+        return {strategy: results[strategy] for strategy in self.strategies}
 
-        return results
+    def _test_strategy(self, strategy: str, url: str) -> Dict[str, Any]:
+        """Executa e mede uma estratégia individual"""
+        try:
+            start_time = time.time()
+            content = self._execute_strategy(strategy, url)
+            execution_time = time.time() - start_time
+
+            return {
+                'success': bool(content and len(content.strip()) > 100),
+                'content_length': len(content) if content else 0,
+                'execution_time': round(execution_time, 2),
+                'preview': content[:200] + '...' if content and len(content) > 200 else content
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'execution_time': 0
+            }
 
     def get_status(self) -> Dict[str, Any]:
         """Retorna status do extrator"""
@@ -324,6 +592,11 @@ class ProductionContentExtractor:
             'jina_reader_url': self.jina_base_url,
             'mercury_api_configured': bool(self.mercury_api_key),
             'timeout': self.timeout,
+            'strategy_timeouts': self.strategy_timeouts,
+            'extraction_budget': self.extraction_budget,
+            'max_workers': self.max_workers,
+            'max_per_host': self.max_per_host,
+            'cached_responses': len(self.cache),
             'user_agents_count': len(self.user_agents)
         }
 
@@ -6,57 +6,291 @@ Gerenciador de busca para produção com rotação de APIs e fallbacks inteligen
 """
 
 import os
+import json
 import logging
 import time
+import hashlib
+import sqlite3
+import threading
+from collections import deque
 import requests
-from urllib.parse import quote_plus
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import quote_plus, urlsplit, urlunsplit, parse_qsl, urlencode
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait, TimeoutError as FuturesTimeoutError
+)
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, TypedDict
+from dataclasses import dataclass
 from services.exa_client import exa_client
 from services.google_api_rotation import GoogleAPIRotation
 
+# orjson é opcional: decodifica as respostas JSON das APIs bem mais rápido quando instalado
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Parser C (lxml) com XPath pré-compilado para a SERP do Bing
+try:
+    from lxml import html as lxml_html
+    from lxml.etree import XPath
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 logger = logging.getLogger(__name__)
 
+class SearchHit(TypedDict, total=False):
+    """Formato de um resultado de busca (dict simples: os consumidores usam .get, alteram e serializam)"""
+    title: str
+    url: str
+    snippet: str
+    source: str
+    score: float
+    published_date: str
+    exa_id: str
+
+
+def _json_loads(content: bytes) -> Any:
+    """Decodifica o corpo JSON da resposta com orjson quando disponível"""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+# Termos que dispensam o complemento regional/temporal da query do Exa
+_BR_TERMS = frozenset({"brasil", "brasileiro", "brasileira", "brasileiros", "brasileiras", "br"})
+_YEAR_TERMS = frozenset({"2024", "2025"})
+
+# Parâmetros de rastreamento ignorados ao comparar URLs
+_TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'msclkid', 'yclid'})
+
+def _canonical_url(url: str) -> str:
+    """Normaliza a URL para comparação: host minúsculo, sem fragmento, barra final ou parâmetros de rastreamento"""
+    parts = urlsplit(url)
+    query = parts.query
+    if query:
+        query = urlencode([
+            (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+            if not key.startswith('utm_') and key not in _TRACKING_PARAMS
+        ])
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
+def _dedupe_results(results: List[SearchHit]) -> List[SearchHit]:
+    """Remove resultados que apontam para a mesma URL canônica, mantendo a primeira ocorrência
+
+    Resultados sem URL (ausente, vazia ou null) são mantidos: não há como compará-los.
+    """
+    seen = set()
+    unique = []
+    for result in results:
+        url = result.get('url') or ''
+        if not url:
+            unique.append(result)
+            continue
+        canonical = _canonical_url(url)
+        if canonical not in seen:
+            seen.add(canonical)
+            unique.append(result)
+    return unique
+
+if HAS_LXML:
+    _BING_RESULTS_XPATH = XPath(
+        "//li[contains(concat(' ', normalize-space(@class), ' '), ' b_algo ')][position() <= $n]"
+    )
+
+@dataclass(slots=True)
+class SearchProvider:
+    """Estado de um provedor de busca"""
+    name: str
+    enabled: bool
+    priority: int
+    max_errors: int = 3
+    error_count: int = 0
+    api_key: Optional[str] = None
+    cse_id: Optional[str] = None
+    base_url: str = ''
+    client: Any = None
+
+
+class TokenBucket:
+    """Rate limiter token bucket: permite rajadas até 'capacity' e repõe 'rate' fichas por segundo"""
+
+    __slots__ = ('capacity', 'tokens', 'rate', 'last', 'daily_limit', 'daily_requests', 'lock')
+
+    def __init__(self, capacity: float, rate: float, daily_limit: Optional[int] = None):
+        self.capacity = capacity
+        self.tokens = capacity
+        self.rate = rate
+        self.last = time.monotonic()
+        self.daily_limit = daily_limit
+        # Timestamps das requisições das últimas 24h (janela deslizante)
+        self.daily_requests = deque()
+        self.lock = threading.Lock()
+
+    def take(self, n: float = 1) -> bool:
+        """Consome n fichas se disponíveis"""
+        with self.lock:
+            now = time.monotonic()
+
+            if self.daily_limit is not None:
+                while self.daily_requests and now - self.daily_requests[0] >= 86400:
+                    self.daily_requests.popleft()
+                if len(self.daily_requests) >= self.daily_limit:
+                    return False
+
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens < n:
+                return False
+
+            self.tokens -= n
+            if self.daily_limit is not None:
+                self.daily_requests.append(now)
+            return True
+
+    def daily_limit_reached(self) -> bool:
+        """Indica se a cota das últimas 24h foi esgotada"""
+        with self.lock:
+            return self.daily_limit is not None and len(self.daily_requests) >= self.daily_limit
+
+
+class SearchDiskCache:
+    """Cache persistente (SQLite em modo WAL) dos resultados de busca
+
+    Sobrevive a reinícios e é compartilhado entre workers; serve de L2 para o cache em memória.
+    """
+
+    def __init__(self, path: str, max_age: float):
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS search_cache ('
+            'key TEXT PRIMARY KEY, results TEXT NOT NULL, provider TEXT, etag TEXT, timestamp REAL NOT NULL)'
+        )
+        self._conn.commit()
+        self._purge_expired()
+
+    @staticmethod
+    def _key(cache_key: tuple) -> str:
+        digest, max_results = cache_key
+        return f"{digest.hex()}:{max_results}"
+
+    def get(self, cache_key: tuple) -> Optional[Dict[str, Any]]:
+        """Retorna a entrada gravada, se ainda dentro de max_age"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT results, provider, etag, timestamp FROM search_cache WHERE key = ?',
+                (self._key(cache_key),)
+            ).fetchone()
+        if row is None or time.time() - row[3] >= self.max_age:
+            return None
+        return {
+            'results': _json_loads(row[0]),
+            'timestamp': row[3],
+            'provider': row[1],
+            'etag': row[2],
+            'revalidating': False
+        }
+
+    def set(self, cache_key: tuple, cache_data: Dict[str, Any]):
+        """Grava (ou substitui) a entrada"""
+        payload = json.dumps(cache_data['results'], ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO search_cache (key, results, provider, etag, timestamp) VALUES (?, ?, ?, ?, ?)',
+                (self._key(cache_key), payload, cache_data['provider'], cache_data['etag'], cache_data['timestamp'])
+            )
+            self._conn.commit()
+            self._writes += 1
+            purge = self._writes % 100 == 0
+        if purge:
+            self._purge_expired()
+
+    def _purge_expired(self):
+        """Remove entradas além de max_age"""
+        with self._lock:
+            self._conn.execute('DELETE FROM search_cache WHERE timestamp < ?', (time.time() - self.max_age,))
+            self._conn.commit()
+
+    def clear(self):
+        """Remove todas as entradas"""
+        with self._lock:
+            self._conn.execute('DELETE FROM search_cache')
+            self._conn.commit()
+
+    def close(self):
+        """Fecha a conexão com o banco"""
+        with self._lock:
+            self._conn.close()
+
+
 class ProductionSearchManager:
     """Gerenciador de busca para produção com sistema de fallback"""
 
     def __init__(self):
         """Inicializa o gerenciador de busca com rotação de APIs"""
-        self.providers = {
-            'exa': {
-                'enabled': exa_client.is_available(),
-                'priority': 1,  # Prioridade máxima
-                'error_count': 0,
-                'max_errors': 3,
-                'client': exa_client
-            },
-            'google': {
-                'enabled': bool(os.getenv('GOOGLE_SEARCH_KEY') and os.getenv('GOOGLE_CSE_ID')),
-                'priority': 2,
-                'error_count': 0,
-                'max_errors': 3,
-                'api_key': os.getenv('GOOGLE_SEARCH_KEY'),
-                'cse_id': os.getenv('GOOGLE_CSE_ID'),
-                'base_url': 'https://www.googleapis.com/customsearch/v1'
-            },
-            'serper': {
-                'enabled': bool(os.getenv('SERPER_API_KEY')),
-                'priority': 3,
-                'error_count': 0,
-                'max_errors': 3,
-                'api_key': os.getenv('SERPER_API_KEY'),
-                'base_url': 'https://google.serper.dev/search'
-            },
-            'bing': {
-                'enabled': True,  # Sempre disponível via scraping
-                'priority': 4,
-                'error_count': 0,
-                'max_errors': 5,
-                'base_url': 'https://www.bing.com/search'
-            }
+        self.providers: Dict[str, SearchProvider] = {
+            'exa': SearchProvider(
+                name='exa',
+                enabled=exa_client.is_available(),
+                priority=1,  # Prioridade máxima
+                client=exa_client
+            ),
+            'google': SearchProvider(
+                name='google',
+                enabled=bool(os.getenv('GOOGLE_SEARCH_KEY') and os.getenv('GOOGLE_CSE_ID')),
+                priority=2,
+                api_key=os.getenv('GOOGLE_SEARCH_KEY'),
+                cse_id=os.getenv('GOOGLE_CSE_ID'),
+                base_url='https://www.googleapis.com/customsearch/v1'
+            ),
+            'serper': SearchProvider(
+                name='serper',
+                enabled=bool(os.getenv('SERPER_API_KEY')),
+                priority=3,
+                api_key=os.getenv('SERPER_API_KEY'),
+                base_url='https://google.serper.dev/search'
+            ),
+            'bing': SearchProvider(
+                name='bing',
+                enabled=True,  # Sempre disponível via scraping
+                priority=4,
+                max_errors=5,
+                base_url='https://www.bing.com/search'
+            )
             # DuckDuckGo removido para otimização de performance e qualidade
         }
 
+        # Tabela de despacho: provedor -> método de busca
+        self._dispatch = {
+            'exa': self._search_exa,
+            'google': self._search_google,
+            'serper': self._search_serper,
+            'bing': self._search_bing
+        }
+
+        # Partes fixas das requisições, montadas uma única vez
+        self._google_params_base = {'lr': 'lang_pt', 'gl': 'br', 'safe': 'off'}
+        self._bing_url_prefix = f"{self.providers['bing'].base_url}?cc=br&setlang=pt-br&q="
+        self._serper_headers = {
+            'X-API-KEY': self.providers['serper'].api_key or '',
+            'Content-Type': 'application/json'
+        }
+
+        # Ordem de provedores memorizada; invalidada ao mudar contadores de erro
+        self._order_version = 0
+        self._order_cache_version = -1
+        self._cached_order: Tuple[str, ...] = ()
+
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -66,107 +300,428 @@ class ProductionSearchManager:
             'Connection': 'keep-alive'
         }
 
+        # Sessão compartilhada: reaproveita conexões keep-alive/TLS entre buscas
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+
+        # Cache LRU limitado, indexado pelo hash da query normalizada
         self.cache = {}
         self.cache_ttl = 3600  # 1 hora
+        self.cache_max_size = 2048
+        # Após o TTL, a entrada ainda é servida por esta janela enquanto é revalidada
+        self.cache_stale_ttl = 3600
+        self._cache_lock = threading.RLock()
+
+        # Cache L2 em disco: preserva resultados entre reinícios/deploys
+        self._disk_cache: Optional[SearchDiskCache] = None
+        if os.getenv('SEARCH_DISK_CACHE', 'true').lower() != 'false':
+            # Padrão fora da árvore do projeto: importar o módulo não deve sujar o repositório
+            cache_path = os.getenv('SEARCH_CACHE_PATH') or os.path.join(
+                os.getenv('XDG_CACHE_HOME') or os.getenv('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache'),
+                'arqv30', 'search_cache.db'
+            )
+            try:
+                self._disk_cache = SearchDiskCache(cache_path, self.cache_ttl + self.cache_stale_ttl)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("⚠️ Cache de busca em disco indisponível: %s", e)
+
+        # Limite de leitura da SERP do Bing (o restante é JS/CSS sem resultados)
+        self.bing_max_bytes = 512 * 1024
+
+        # Busca paralela: quantos provedores disputam e tempo máximo de espera
+        self.concurrent_providers = 3
+        self.request_timeout = 15
+        # Espera pelo provedor atual antes de acionar o próximo em paralelo (hedged request)
+        self.hedge_delay = 2.0
+
+        # Buscas em andamento, compartilhadas entre chamadas simultâneas da mesma query
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.inflight_timeout = 20
 
         # Sistema de rotação para Google Search
         self.google_api_rotation = GoogleAPIRotation()
 
-        # Rate limiting por provedor
+        # Rate limiting por provedor (token bucket + cota diária em janela de 24h)
         self.rate_limits = {
-            'google': {'last_request': 0, 'delay': 1.0, 'requests_count': 0, 'daily_limit': 100},
-            'exa': {'last_request': 0, 'delay': 0.5, 'requests_count': 0, 'daily_limit': 1000},
-            'duckduckgo': {'last_request': 0, 'delay': 2.0, 'requests_count': 0, 'daily_limit': 500},
-            'fallback': {'last_request': 0, 'delay': 0.1, 'requests_count': 0, 'daily_limit': 10000}
+            'google': TokenBucket(capacity=10, rate=1.0, daily_limit=100),
+            'exa': TokenBucket(capacity=20, rate=2.0, daily_limit=1000)
         }
 
-        enabled_count = sum(1 for p in self.providers.values() if p['enabled'])
-        logger.info(f"Production Search Manager inicializado com {enabled_count} provedores e rotação de APIs")
+        enabled_count = sum(1 for p in self.providers.values() if p.enabled)
+        logger.info("Production Search Manager inicializado com %s provedores e rotação de APIs", enabled_count)
+
+    def search_with_fallback(self, query: str, max_results: int = 10, concurrent: bool = False) -> List[SearchHit]:
+        """Realiza busca com sistema de fallback automático
 
-    def search_with_fallback(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
-        """Realiza busca com sistema de fallback automático"""
+        O próximo provedor é acionado quando o atual falha ou demora mais que hedge_delay.
+        Com concurrent=True, os provedores mais prioritários são consultados em paralelo
+        e vence o primeiro que retornar resultados.
+        """
 
         # Verifica cache primeiro
-        cache_key = f"{query}_{max_results}"
-        if cache_key in self.cache:
-            cache_data = self.cache[cache_key]
-            if time.time() - cache_data['timestamp'] < self.cache_ttl:
-                logger.info(f"🔄 Resultado do cache para: {query}")
-                return cache_data['results']
+        cache_key = self._cache_key(query, max_results)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info("🔄 Resultado do cache para: %s", query)
+            return cached
+
+        # Stale-while-revalidate: entrega o resultado vencido e atualiza em segundo plano
+        stale = self._cache_get_stale(cache_key)
+        if stale is not None:
+            logger.info("🔄 Resultado vencido do cache para: %s (revalidando)", query)
+            self._schedule_revalidation(query, max_results, cache_key)
+            return stale
+
+        # Singleflight: chamadas simultâneas para a mesma query aguardam a busca em andamento
+        with self._inflight_lock:
+            inflight = self._inflight.get(cache_key)
+            if inflight is None:
+                inflight = self._inflight[cache_key] = Future()
+                owner = True
+            else:
+                owner = False
 
+        if not owner:
+            logger.info("⏳ Aguardando busca em andamento para: %s", query)
+            try:
+                return inflight.result(timeout=self.inflight_timeout)
+            except FuturesTimeoutError:
+                # A busca do dono pode legitimamente durar mais (vários provedores lentos):
+                # em vez de devolver vazio, este chamador faz a própria busca
+                logger.warning("⏱️ Busca em andamento excedeu %ss para: %s (buscando diretamente)",
+                               self.inflight_timeout, query)
+                return self._run_search(query, max_results, cache_key, concurrent)
+
+        results = []
+        try:
+            results = self._run_search(query, max_results, cache_key, concurrent)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+            inflight.set_result(results)
+
+        return results
+
+    def _run_search(self, query: str, max_results: int, cache_key: tuple, concurrent: bool) -> List[SearchHit]:
+        """Busca escalonada; com concurrent=True os provedores prioritários disputam em paralelo"""
+        if concurrent:
+            return self._search_hedged(query, max_results, cache_key, 0, self.concurrent_providers)
+        return self._search_hedged(query, max_results, cache_key, self.hedge_delay)
+
+    def _search_sequential(self, query: str, max_results: int, cache_key: tuple) -> List[SearchHit]:
+        """Consulta os provedores em ordem de prioridade até obter resultados"""
         # Busca com fallback
         for provider_name in self._get_provider_order():
             if not self._is_provider_available(provider_name):
                 continue
 
             try:
-                logger.info(f"🔍 Buscando com {provider_name}: {query}")
-
-                if provider_name == 'google':
-                    results = self._search_google(query, max_results)
-                elif provider_name == 'serper':
-                    results = self._search_serper(query, max_results)
-                elif provider_name == 'bing':
-                    results = self._search_bing(query, max_results)
-                else:
-                    continue
+                logger.info("🔍 Buscando com %s: %s", provider_name, query)
+
+                meta = {}
+                results = self._search_provider(provider_name, query, max_results, meta)
 
                 if results:
-                    # Cache resultado
-                    self.cache[cache_key] = {
-                        'results': results,
-                        'timestamp': time.time(),
-                        'provider': provider_name
-                    }
-
-                    logger.info(f"✅ {provider_name}: {len(results)} resultados")
+                    self._cache_set(cache_key, results, provider_name, etag=meta.get('etag'))
+
+                    logger.info("✅ %s: %s resultados", provider_name, len(results))
                     return results
                 else:
-                    logger.warning(f"⚠️ {provider_name}: 0 resultados")
+                    logger.warning("⚠️ %s: 0 resultados", provider_name)
 
             except Exception as e:
-                logger.error(f"❌ Erro em {provider_name}: {str(e)}")
+                logger.error("❌ Erro em %s: %s", provider_name, e)
                 self._record_provider_error(provider_name)
                 continue
 
         logger.error("❌ Todos os provedores de busca falharam")
         return []
 
-    def _get_provider_order(self) -> List[str]:
-        """Retorna provedores ordenados por prioridade"""
-        available_providers = [
-            (name, provider) for name, provider in self.providers.items()
-            if self._is_provider_available(name)
-        ]
+    def search_many(self, queries: List[str], max_results: int = 10) -> Dict[str, List[SearchHit]]:
+        """Realiza várias buscas de uma vez
+
+        Queries repetidas são buscadas uma única vez e as que estão em cache não geram
+        requisições. Quando a Serper é o provedor prioritário, as demais vão em um único
+        lote; o restante é buscado em paralelo com fallback normal.
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        results_by_query = {}
+        pending = []
+
+        for query in unique_queries:
+            cached = self._cache_get(self._cache_key(query, max_results))
+            if cached is not None:
+                results_by_query[query] = cached
+            else:
+                pending.append(query)
+
+        if not pending:
+            return results_by_query
+
+        provider_order = self._get_provider_order()
+        if len(pending) > 1 and provider_order and provider_order[0] == 'serper':
+            try:
+                batch_results = self._search_serper_batch(pending, max_results)
+            except Exception as e:
+                logger.error("❌ Erro no lote da serper: %s", e)
+                self._record_provider_error('serper')
+                batch_results = []
 
-        # Ordena por prioridade e número de erros
-        available_providers.sort(key=lambda x: (x[1]['priority'], x[1]['error_count']))
+            for query, results in zip(pending, batch_results):
+                if results:
+                    self._cache_set(self._cache_key(query, max_results), results, 'serper')
+                    results_by_query[query] = results
+            pending = [query for query in pending if query not in results_by_query]
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(len(pending), 8)) as executor:
+                future_to_query = {
+                    executor.submit(self.search_with_fallback, query, max_results): query
+                    for query in pending
+                }
+                for future in as_completed(future_to_query):
+                    query = future_to_query[future]
+                    try:
+                        results_by_query[query] = future.result()
+                    except Exception as e:
+                        logger.error("❌ Erro buscando '%s': %s", query, e)
+                        results_by_query[query] = []
+
+        return results_by_query
+
+    def _cache_key(self, query: str, max_results: int) -> tuple:
+        """Gera chave de cache a partir da query normalizada (caixa e espaços)"""
+        normalized = ' '.join(query.lower().split())
+        return (hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).digest(), max_results)
+
+    def _cache_get(self, cache_key: tuple) -> Optional[List[SearchHit]]:
+        """Retorna resultados em cache ainda válidos, removendo entradas além da janela stale"""
+        if self._disk_cache is not None and cache_key not in self.cache:
+            self._load_from_disk(cache_key)
+
+        with self._cache_lock:
+            cache_data = self.cache.pop(cache_key, None)
+            if cache_data is None:
+                return None
+            age = time.time() - cache_data['timestamp']
+            if age >= self.cache_ttl + self.cache_stale_ttl:
+                return None
+            # Reinsere no fim para manter a ordem LRU
+            self.cache[cache_key] = cache_data
+            if age >= self.cache_ttl:
+                return None
+            return cache_data['results']
+
+    def _load_from_disk(self, cache_key: tuple):
+        """Promove uma entrada do cache em disco (L2) para o cache em memória (L1)"""
+        try:
+            cache_data = self._disk_cache.get(cache_key)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("⚠️ Erro lendo cache de busca em disco: %s", e)
+            return
+
+        if cache_data is None:
+            return
+
+        with self._cache_lock:
+            if cache_key not in self.cache:
+                if len(self.cache) >= self.cache_max_size:
+                    self.cache.pop(next(iter(self.cache)))
+                self.cache[cache_key] = cache_data
+
+    def _cache_get_stale(self, cache_key: tuple) -> Optional[List[SearchHit]]:
+        """Retorna resultados vencidos, mas ainda dentro da janela stale-while-revalidate"""
+        with self._cache_lock:
+            cache_data = self.cache.get(cache_key)
+            if cache_data is None:
+                return None
+            if time.time() - cache_data['timestamp'] >= self.cache_ttl + self.cache_stale_ttl:
+                return None
+            return cache_data['results']
+
+    def _cache_set(self, cache_key: tuple, results: List[SearchHit], provider_name: str,
+                   etag: Optional[str] = None):
+        """Armazena resultados, descartando a entrada menos usada quando cheio"""
+        with self._cache_lock:
+            self.cache.pop(cache_key, None)
+            if len(self.cache) >= self.cache_max_size:
+                self.cache.pop(next(iter(self.cache)))
+            cache_data = self.cache[cache_key] = {
+                'results': results,
+                'timestamp': time.time(),
+                'provider': provider_name,
+                'etag': etag,
+                'revalidating': False
+            }
 
-        return [name for name, _ in available_providers]
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache.set(cache_key, cache_data)
+            except sqlite3.Error as e:
+                logger.warning("⚠️ Erro gravando cache de busca em disco: %s", e)
+
+    def _schedule_revalidation(self, query: str, max_results: int, cache_key: tuple):
+        """Dispara a atualização de uma entrada vencida, uma por vez por entrada"""
+        with self._cache_lock:
+            cache_data = self.cache.get(cache_key)
+            if cache_data is None or cache_data['revalidating']:
+                return
+            cache_data['revalidating'] = True
+
+        threading.Thread(
+            target=self._revalidate,
+            args=(query, max_results, cache_key, cache_data),
+            daemon=True
+        ).start()
+
+    def _revalidate(self, query: str, max_results: int, cache_key: tuple, cache_data: Dict[str, Any]):
+        """Atualiza uma entrada vencida; com ETag, uma resposta 304 apenas renova o timestamp"""
+        try:
+            if cache_data['etag'] and cache_data['provider'] == 'google' and self._is_provider_available('google'):
+                meta = {}
+                results = self._search_google(query, max_results, etag=cache_data['etag'], meta=meta)
+                if results is None:
+                    self._cache_set(cache_key, cache_data['results'], 'google', etag=cache_data['etag'])
+                    logger.info("🔄 Cache revalidado (304) para: %s", query)
+                    return
+                if results:
+                    self._cache_set(cache_key, results, 'google', etag=meta.get('etag'))
+                    return
+
+            self._search_sequential(query, max_results, cache_key)
+        except Exception as e:
+            logger.error("❌ Erro revalidando cache para '%s': %s", query, e)
+        finally:
+            cache_data['revalidating'] = False
+
+    def _search_hedged(self, query: str, max_results: int, cache_key: tuple,
+                       hedge_delay: float, max_providers: Optional[int] = None) -> List[SearchHit]:
+        """Busca com requisições escalonadas (hedged requests)
+
+        O provedor prioritário é consultado imediatamente; o próximo da ordem só é acionado
+        se o anterior falhar ou não responder em hedge_delay segundos. Vence o primeiro
+        resultado não vazio e os provedores mais lentos são descartados. Com hedge_delay=0
+        todos os provedores selecionados disputam em paralelo.
+        """
+        order = list(self._get_provider_order()[:max_providers])
+        if not order:
+            logger.error("❌ Nenhum provedor de busca disponível")
+            return []
+
+        executor = ThreadPoolExecutor(max_workers=len(order))
+        pending = {}
+        metas = {}
+
+        def launch_next():
+            provider_name = order.pop(0)
+            metas[provider_name] = {}
+            logger.info("🔍 Buscando com %s: %s", provider_name, query)
+            future = executor.submit(self._search_provider, provider_name, query, max_results, metas[provider_name])
+            pending[future] = provider_name
+
+        try:
+            launch_next()
+            while pending:
+                done, _ = wait(
+                    pending,
+                    timeout=hedge_delay if order else self.request_timeout,
+                    return_when=FIRST_COMPLETED
+                )
+
+                if not done:
+                    if not order:
+                        logger.warning("⏱️ Busca excedeu %ss para: %s", self.request_timeout, query)
+                        break
+                    # Provedor lento: aciona o próximo sem cancelar o atual
+                    launch_next()
+                    continue
+
+                for future in done:
+                    provider_name = pending.pop(future)
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        logger.error("❌ Erro em %s: %s", provider_name, e)
+                        self._record_provider_error(provider_name)
+                        continue
+
+                    if results:
+                        self._cache_set(cache_key, results, provider_name, etag=metas[provider_name].get('etag'))
+                        logger.info("✅ %s: %s resultados", provider_name, len(results))
+                        return results
+                    logger.warning("⚠️ %s: 0 resultados", provider_name)
+
+                # Falha ou resultado vazio: aciona o próximo imediatamente
+                if order:
+                    launch_next()
+        finally:
+            # Não espera os provedores mais lentos
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.error("❌ Todos os provedores de busca falharam")
+        return []
+
+    def _search_provider(self, provider_name: str, query: str, max_results: int,
+                         meta: Optional[Dict[str, Any]] = None) -> List[SearchHit]:
+        """Executa a busca no provedor indicado; 'meta' recebe metadados HTTP como o ETag"""
+        search_fn = self._dispatch.get(provider_name)
+        if search_fn is None:
+            return []
+        if provider_name == 'google':
+            return search_fn(query, max_results, meta=meta)
+        return search_fn(query, max_results)
+
+    def _get_provider_order(self) -> Tuple[str, ...]:
+        """Retorna provedores ordenados por prioridade
+
+        A ordem só muda quando contadores de erro mudam, então fica memorizada até
+        _order_version ser incrementado.
+        """
+        if self._order_cache_version != self._order_version:
+            # Ordena por prioridade e número de erros
+            self._cached_order = tuple(sorted(
+                (name for name, provider in self.providers.items()
+                 if provider.enabled and provider.error_count < provider.max_errors),
+                key=lambda name: (self.providers[name].priority, self.providers[name].error_count)
+            ))
+            self._order_cache_version = self._order_version
+
+        return self._cached_order
 
     def _is_provider_available(self, provider_name: str) -> bool:
         """Verifica se provedor está disponível"""
-        provider = self.providers.get(provider_name, {})
-        return (provider.get('enabled', False) and 
-                provider.get('error_count', 0) < provider.get('max_errors', 3))
+        provider = self.providers.get(provider_name)
+        return provider is not None and provider.enabled and provider.error_count < provider.max_errors
 
     def _record_provider_error(self, provider_name: str):
         """Registra erro do provedor"""
         if provider_name in self.providers:
-            self.providers[provider_name]['error_count'] += 1
+            self.providers[provider_name].error_count += 1
+            self._order_version += 1
 
-            if self.providers[provider_name]['error_count'] >= self.providers[provider_name]['max_errors']:
-                logger.warning(f"⚠️ Provedor {provider_name} desabilitado temporariamente")
+            if self.providers[provider_name].error_count >= self.providers[provider_name].max_errors:
+                logger.warning("⚠️ Provedor %s desabilitado temporariamente", provider_name)
 
-    def _search_google(self, query: str, max_results: int) -> List[Dict[str, Any]]:
-        """Busca usando Google Custom Search API com rotação"""
+    def _search_google(self, query: str, max_results: int, etag: Optional[str] = None,
+                       meta: Optional[Dict[str, Any]] = None) -> Optional[List[SearchHit]]:
+        """Busca usando Google Custom Search API com rotação
+
+        Com etag, faz uma requisição condicional e retorna None se o resultado não mudou (304).
+        O ETag da resposta é gravado em meta['etag'] quando meta é informado.
+        """
         provider = self.providers['google']
 
         # Verifica e aplica rate limit
         if not self._can_make_request('google'):
             logger.warning("⚠️ Google Search API: Limite de requisição atingido, pulando.")
             return []
-        self._update_request_time('google')
 
         # Obtém a próxima chave de API e CSE ID
         current_key, current_cse_id = self.google_api_rotation.get_next_api_keys()
@@ -177,58 +732,58 @@ class ProductionSearchManager:
             self._record_provider_error('google')
             raise Exception("Google API keys não configuradas")
 
-        params = {
+        params = self._google_params_base | {
             'key': current_key,
             'cx': current_cse_id,
             'q': query,
-            'num': min(max_results, 10),
-            'lr': 'lang_pt',
-            'gl': 'br',
-            'safe': 'off'
+            'num': min(max_results, 10)
         }
 
-        response = requests.get(
-            provider['base_url'],
+        response = self.session.get(
+            provider.base_url,
             params=params,
-            headers=self.headers,
+            headers={'If-None-Match': etag} if etag else None,
+            stream=True,
             timeout=15
         )
 
-        if response.status_code == 200:
-            data = response.json()
-            results = []
-
-            for item in data.get('items', []):
-                results.append({
-                    'title': item.get('title', ''),
-                    'url': item.get('link', ''),
-                    'snippet': item.get('snippet', ''),
-                    'source': 'google'
-                })
-
-            # Atualiza o tempo da última requisição bem-sucedida para Google
-            self._update_successful_request_time('google')
-            return results
-        else:
-            error_msg = f"Google API retornou status {response.status_code}"
-            if current_key:
-                error_msg += f" com chave {current_key[:10]}..."
-            else:
-                error_msg += " - nenhuma chave disponível"
-
-            logger.error(f"❌ Erro em google: {error_msg}")
+        status = response.status_code
+        if status != 200:
+            # Caminho de falha: libera a conexão sem baixar o corpo
+            response.close()
+
+            if etag and status == 304:
+                return None
+
+            logger.error("❌ Erro em google: Google API retornou status %s com chave %.10s...", status, current_key)
+
+            if status == 403:
+                # Marca a chave como inválida
+                self.google_api_rotation.mark_key_invalid(current_key)
+                raise Exception("Google API key inválida (403)")
+
+            self._record_provider_error('google') # Registra erro se falhar
+            raise Exception(f"Google API retornou status {status}")
+
+        if meta is not None:
+            meta['etag'] = response.headers.get('ETag')
+        data = _json_loads(response.content)
+        results: List[SearchHit] = [
+            {
+                'title': item.get('title', ''),
+                'url': item.get('link', ''),
+                'snippet': item.get('snippet', ''),
+                'source': 'google'
+            }
+            for item in data.get('items', ())
+        ]
 
-            if response.status_code == 403:
-                if current_key:
-                    # Marca a chave como inválida apenas se existe
-                    self.google_api_rotation.mark_key_invalid(current_key)
-                    raise Exception("Google API key inválida (403)")
-            else:
-                 self._record_provider_error('google') # Registra erro se falhar
-                 raise Exception(f"Google API retornou status {response.status_code}")
+        # Atualiza o tempo da última requisição bem-sucedida para Google
+        self._update_successful_request_time('google')
+        return _dedupe_results(results)
 
 
-    def _search_serper(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+    def _search_serper(self, query: str, max_results: int) -> List[SearchHit]:
         """Busca usando Serper API"""
         provider = self.providers['serper']
 
@@ -236,13 +791,6 @@ class ProductionSearchManager:
         if not self._can_make_request('serper'):
             logger.warning("⚠️ Serper API: Limite de requisição atingido, pulando.")
             return []
-        self._update_request_time('serper')
-
-        headers = {
-            **self.headers,
-            'X-API-KEY': provider['api_key'],
-            'Content-Type': 'application/json'
-        }
 
         payload = {
             'q': query,
@@ -251,75 +799,161 @@ class ProductionSearchManager:
             'num': max_results
         }
 
-        response = requests.post(
-            provider['base_url'],
+        response = self.session.post(
+            provider.base_url,
             json=payload,
-            headers=headers,
+            headers=self._serper_headers,
+            stream=True,
             timeout=15
         )
 
-        if response.status_code == 200:
-            data = response.json()
-            results = []
+        if response.status_code != 200:
+            # Caminho de falha: libera a conexão sem baixar o corpo
+            response.close()
+            self._record_provider_error('serper') # Registra erro se falhar
+            raise Exception(f"Serper API retornou status {response.status_code}")
 
-            for item in data.get('organic', []):
-                results.append({
-                    'title': item.get('title', ''),
-                    'url': item.get('link', ''),
-                    'snippet': item.get('snippet', ''),
-                    'source': 'serper'
-                })
+        results = self._parse_serper_results(_json_loads(response.content))
 
-            # Atualiza o tempo da última requisição bem-sucedida para Serper
-            self._update_successful_request_time('serper')
-            return results
-        else:
+        # Atualiza o tempo da última requisição bem-sucedida para Serper
+        self._update_successful_request_time('serper')
+        return results
+
+    def _search_serper_batch(self, queries: List[str], max_results: int) -> List[List[SearchHit]]:
+        """Busca várias queries em uma única requisição à Serper API (payload em lista)"""
+        provider = self.providers['serper']
+
+        if not self._can_make_request('serper'):
+            logger.warning("⚠️ Serper API: Limite de requisição atingido, pulando.")
+            return []
+
+        payload = [
+            {'q': query, 'gl': 'br', 'hl': 'pt', 'num': max_results}
+            for query in queries
+        ]
+
+        response = self.session.post(
+            provider.base_url,
+            json=payload,
+            headers=self._serper_headers,
+            stream=True,
+            timeout=15
+        )
+
+        if response.status_code != 200:
+            # Caminho de falha: libera a conexão sem baixar o corpo
+            response.close()
             self._record_provider_error('serper') # Registra erro se falhar
             raise Exception(f"Serper API retornou status {response.status_code}")
 
-    def _search_bing(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        data = _json_loads(response.content)
+        if not isinstance(data, list) or len(data) != len(queries):
+            raise Exception("Serper API retornou lote em formato inesperado")
+
+        self._update_successful_request_time('serper')
+        return [self._parse_serper_results(item) for item in data]
+
+    def _parse_serper_results(self, data: Dict[str, Any]) -> List[SearchHit]:
+        """Converte a resposta da Serper em resultados padronizados"""
+        results: List[SearchHit] = [
+            {
+                'title': item.get('title', ''),
+                'url': item.get('link', ''),
+                'snippet': item.get('snippet', ''),
+                'source': 'serper'
+            }
+            for item in data.get('organic', ())
+        ]
+
+        return _dedupe_results(results)
+
+    def _search_bing(self, query: str, max_results: int) -> List[SearchHit]:
         """Busca usando Bing (scraping)"""
         # Verifica e aplica rate limit
         if not self._can_make_request('bing'):
             logger.warning("⚠️ Bing Scraping: Limite de requisição atingido, pulando.")
             return []
-        self._update_request_time('bing')
 
-        search_url = f"{self.providers['bing']['base_url']}?q={quote_plus(query)}&cc=br&setlang=pt-br&count={max_results}"
-
-        response = requests.get(search_url, headers=self.headers, timeout=15)
-
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            results = []
-
-            result_items = soup.find_all('li', class_='b_algo')
-
-            for item in result_items[:max_results]:
-                title_elem = item.find('h2')
-                if title_elem:
-                    link_elem = title_elem.find('a')
-                    if link_elem:
-                        title = title_elem.get_text(strip=True)
-                        url = link_elem.get('href', '')
+        search_url = f"{self._bing_url_prefix}{quote_plus(query)}&count={max_results}"
+
+        with self.session.get(search_url, headers={'Accept': 'text/html'}, stream=True, timeout=15) as response:
+            if response.status_code != 200:
+                # Caminho de falha: o corpo não é lido e a conexão é liberada ao sair do bloco
+                self._record_provider_error('bing') # Registra erro se falhar
+                raise Exception(f"Bing retornou status {response.status_code}")
+            content = self._read_bing_results_html(response)
+
+        results = self._parse_bing_results(content, max_results)
+
+        # Atualiza o tempo da última requisição bem-sucedida para Bing
+        self._update_successful_request_time('bing')
+        return _dedupe_results(results)
+
+    def _read_bing_results_html(self, response: requests.Response) -> bytes:
+        """Lê a SERP em streaming até o fim da lista de resultados orgânicos ou bing_max_bytes"""
+        buf = bytearray()
+        results_start = -1
+        for chunk in response.iter_content(chunk_size=8192):
+            # Recomeça a busca um pouco antes para pegar marcadores divididos entre chunks
+            search_from = max(len(buf) - 16, 0)
+            buf.extend(chunk)
+            if len(buf) >= self.bing_max_bytes:
+                break
+            if results_start < 0:
+                results_start = buf.find(b'id="b_results"', search_from)
+                if results_start < 0:
+                    continue
+                search_from = results_start
+            if buf.find(b'</ol>', search_from) >= 0:
+                break
+        return bytes(buf[:self.bing_max_bytes])
+
+    def _parse_bing_results(self, content: bytes, max_results: int) -> List[SearchHit]:
+        """Extrai título, URL e snippet dos resultados orgânicos do Bing"""
+        results = []
+
+        if HAS_LXML:
+            doc = lxml_html.fromstring(content)
+            for item in _BING_RESULTS_XPATH(doc, n=max_results):
+                link_elem = item.find('.//h2/a')
+                if link_elem is None:
+                    continue
 
-                        snippet_elem = item.find('p')
-                        snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
+                title = link_elem.text_content().strip()
+                url = link_elem.get('href', '')
 
-                        if url and title and url.startswith('http'):
-                            results.append({
-                                'title': title,
-                                'url': url,
-                                'snippet': snippet,
-                                'source': 'bing'
-                            })
+                snippet_elem = item.find('.//p')
+                snippet = snippet_elem.text_content().strip() if snippet_elem is not None else ""
 
-            # Atualiza o tempo da última requisição bem-sucedida para Bing
-            self._update_successful_request_time('bing')
+                if url and title and url.startswith('http'):
+                    results.append({
+                        'title': title,
+                        'url': url,
+                        'snippet': snippet,
+                        'source': 'bing'
+                    })
             return results
-        else:
-            self._record_provider_error('bing') # Registra erro se falhar
-            raise Exception(f"Bing retornou status {response.status_code}")
+
+        soup = BeautifulSoup(content, 'html.parser')
+        for item in soup.find_all('li', class_='b_algo', limit=max_results):
+            title_elem = item.find('h2')
+            if title_elem:
+                link_elem = title_elem.find('a')
+                if link_elem:
+                    title = title_elem.get_text(strip=True)
+                    url = link_elem.get('href', '')
+
+                    snippet_elem = item.find('p')
+                    snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
+
+                    if url and title and url.startswith('http'):
+                        results.append({
+                            'title': title,
+                            'url': url,
+                            'snippet': snippet,
+                            'source': 'bing'
+                        })
+        return results
 
     # MÉTODO _search_duckduckgo REMOVIDO CONFORME PLANO DE OTIMIZAÇÃO
     # DuckDuckGo foi removido para melhorar performance e qualidade dos resultados
@@ -333,11 +967,11 @@ class ProductionSearchManager:
 
         for name, provider in self.providers.items():
             status[name] = {
-                'enabled': provider['enabled'],
+                'enabled': provider.enabled,
                 'available': self._is_provider_available(name),
-                'priority': provider['priority'],
-                'error_count': provider['error_count'],
-                'max_errors': provider['max_errors']
+                'priority': provider.priority,
+                'error_count': provider.error_count,
+                'max_errors': provider.max_errors
             }
 
         return status
@@ -346,18 +980,29 @@ class ProductionSearchManager:
         """Reset contadores de erro dos provedores"""
         if provider_name:
             if provider_name in self.providers:
-                self.providers[provider_name]['error_count'] = 0
-                logger.info(f"🔄 Reset erros do provedor: {provider_name}")
+                self.providers[provider_name].error_count = 0
+                self._order_version += 1
+                logger.info("🔄 Reset erros do provedor: %s", provider_name)
         else:
             for provider in self.providers.values():
-                provider['error_count'] = 0
+                provider.error_count = 0
+            self._order_version += 1
             logger.info("🔄 Reset erros de todos os provedores")
 
     def clear_cache(self):
         """Limpa cache de busca"""
-        self.cache = {}
+        with self._cache_lock:
+            self.cache = {}
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
         logger.info("🧹 Cache de busca limpo")
 
+    def close(self):
+        """Fecha a sessão HTTP e libera as conexões do pool e o cache em disco"""
+        self.session.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
     def test_provider(self, provider_name: str) -> bool:
         """Testa um provedor específico"""
         if provider_name not in self.providers:
@@ -366,30 +1011,23 @@ class ProductionSearchManager:
         try:
             test_query = "teste mercado digital Brasil"
 
-            if provider_name == 'google':
-                results = self._search_google(test_query, 3)
-            elif provider_name == 'serper':
-                results = self._search_serper(test_query, 3)
-            elif provider_name == 'bing':
-                results = self._search_bing(test_query, 3)
-            elif provider_name == 'exa':
-                results = self._search_exa(test_query, 3)
-            else:
+            search_fn = self._dispatch.get(provider_name)
+            if search_fn is None:
                 return False
 
+            results = search_fn(test_query, 3)
             return len(results) > 0
 
         except Exception as e:
-            logger.error(f"❌ Teste do provedor {provider_name} falhou: {e}")
+            logger.error("❌ Teste do provedor %s falhou: %s", provider_name, e)
             return False
 
-    def _search_exa(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+    def _search_exa(self, query: str, max_results: int) -> List[SearchHit]:
         """Busca usando Exa Neural Search"""
         # Verifica e aplica rate limit
         if not self._can_make_request('exa'):
             logger.warning("⚠️ Exa Search: Limite de requisição atingido, pulando.")
             return []
-        self._update_request_time('exa')
 
         try:
             # Melhora query para mercado brasileiro
@@ -413,70 +1051,57 @@ class ProductionSearchManager:
             if not exa_response or 'results' not in exa_response:
                 raise Exception("Exa não retornou resultados válidos")
 
-            results = []
-            for item in exa_response['results']:
-                results.append({
+            results: List[SearchHit] = [
+                {
                     'title': item.get('title', ''),
                     'url': item.get('url', ''),
-                    'snippet': item.get('text', '')[:300],
+                    'snippet': (item.get('text') or '')[:300],
                     'source': 'exa',
                     'score': item.get('score', 0),
                     'published_date': item.get('publishedDate', ''),
                     'exa_id': item.get('id', '')
-                })
+                }
+                for item in exa_response['results']
+            ]
 
             # Atualiza o tempo da última requisição bem-sucedida para Exa
             self._update_successful_request_time('exa')
-            return results
+            return _dedupe_results(results)
 
         except Exception as e:
             if "quota" in str(e).lower() or "limit" in str(e).lower():
-                logger.warning(f"⚠️ Exa atingiu limite: {str(e)}")
+                logger.warning("⚠️ Exa atingiu limite: %s", e)
             self._record_provider_error('exa') # Registra erro se falhar
             raise e
 
     def _enhance_query_for_brazil(self, query: str) -> str:
         """Melhora query para pesquisa no Brasil"""
-        enhanced_query = query
-        query_lower = query.lower()
+        tokens = set(query.lower().split())
+        parts = [query.strip()]
 
         # Adiciona termos brasileiros se não estiverem presentes
-        if not any(term in query_lower for term in ["brasil", "brasileiro", "br"]):
-            enhanced_query += " Brasil"
+        if tokens.isdisjoint(_BR_TERMS):
+            parts.append("Brasil")
 
         # Adiciona ano atual se não estiver presente
-        if not any(year in query for year in ["2024", "2025"]):
-            enhanced_query += " 2024"
+        if tokens.isdisjoint(_YEAR_TERMS):
+            parts.append("2024")
 
-        return enhanced_query.strip()
+        return " ".join(parts).strip()
 
     # Métodos auxiliares para Rate Limiting e Rotação de APIs
     def _can_make_request(self, provider_name: str) -> bool:
-        """Verifica se é possível fazer uma requisição para o provedor"""
-        if provider_name not in self.rate_limits:
+        """Verifica se é possível fazer uma requisição para o provedor, consumindo uma ficha"""
+        bucket = self.rate_limits.get(provider_name)
+        if bucket is None:
             return True
 
-        current_time = time.time()
-        provider_limits = self.rate_limits[provider_name]
-
-        # Verifica se o limite diário foi atingido
-        # (Uma implementação mais robusta precisaria persistir o contador diário)
-        # Para este exemplo, vamos assumir que o contador é resetado ao reiniciar o script
-        if provider_limits['requests_count'] >= provider_limits['daily_limit']:
-            logger.warning(f"⚠️ Limite diário de requisições para {provider_name} atingido.")
-            return False
-
-        # Verifica o delay entre requisições
-        if current_time - provider_limits['last_request'] < provider_limits['delay']:
-            return False
-
-        return True
+        if bucket.take():
+            return True
 
-    def _update_request_time(self, provider_name: str):
-        """Atualiza o tempo da última requisição para o provedor"""
-        if provider_name in self.rate_limits:
-            self.rate_limits[provider_name]['last_request'] = time.time()
-            self.rate_limits[provider_name]['requests_count'] += 1
+        if bucket.daily_limit_reached():
+            logger.warning("⚠️ Limite diário de requisições para %s atingido.", provider_name)
+        return False
 
     def _update_successful_request_time(self, provider_name: str):
         """Atualiza o tempo da última requisição bem-sucedida, resetando contador se necessário"""
@@ -486,35 +1111,6 @@ class ProductionSearchManager:
             # O 'delay' pode ser ajustado dinamicamente com base no sucesso.
             pass # A lógica de ajuste dinâmico de delay não está implementada aqui.
 
-    # Classe fictícia para representar a rotação de APIs do Google Search
-    # Em um cenário real, esta classe gerenciaria múltiplas chaves e IDs
-    class GoogleAPIRotation:
-        def __init__(self):
-            self.keys = [
-                (os.getenv('GOOGLE_SEARCH_KEY'), os.getenv('GOOGLE_CSE_ID'))
-                # Adicione mais pares de chave/CSE ID aqui se disponíveis
-            ]
-            self.current_index = 0
-            self.valid_keys = [(k, c) for k, c in self.keys if k and c]
-            if not self.valid_keys:
-                logger.error("Nenhuma chave de API do Google Search válida encontrada.")
-
-        def get_next_api_keys(self) -> tuple[Optional[str], Optional[str]]:
-            if not self.valid_keys:
-                return None, None
-
-            key_pair = self.valid_keys[self.current_index]
-            self.current_index = (self.current_index + 1) % len(self.valid_keys)
-            return key_pair
-        
-        def mark_key_invalid(self, key_to_invalidate: str):
-            """Marca uma chave como inválida para evitar seu uso futuro"""
-            self.valid_keys = [(k, c) for k, c in self.valid_keys if k != key_to_invalidate]
-            if not self.valid_keys:
-                logger.error("Todas as chaves de API do Google Search se tornaram inválidas.")
-            else:
-                logger.warning(f"Chave de API Google marcada como inválida: {key_to_invalidate[:10]}...")
-
 
 # Instância global
 production_search_manager = ProductionSearchManager()
\ No newline at end of file
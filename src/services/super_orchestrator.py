@@ -6,11 +6,22 @@ Coordena TODOS os serviços em perfeita sintonia
 """
 
 import os
+import json
+import queue
+import atexit
+import copy
 import logging
 import time
 import asyncio
+import hashlib
+import itertools
+import contextvars
 import threading
-from typing import Dict, List, Any, Optional, Callable
+from types import MappingProxyType
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial, wraps
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
@@ -28,14 +39,303 @@ from services.anti_objection_system import anti_objection_system
 from services.pre_pitch_architect import pre_pitch_architect
 from services.future_prediction_engine import future_prediction_engine
 from services.mcp_supadata_manager import mcp_supadata_manager
-from services.auto_save_manager import salvar_etapa, salvar_erro
+from services.auto_save_manager import auto_save_manager, salvar_etapa, salvar_etapas_batch, salvar_erro
 from services.alibaba_websailor import AlibabaWebSailorAgent
 
 logger = logging.getLogger(__name__)
 
+# Sessão em execução na thread atual; evita repassar session_id pelos métodos auxiliares.
+# Não se propaga para as threads do pool de componentes, que leem data['session_id']
+_SESSION_ID: contextvars.ContextVar[str] = contextvars.ContextVar('session_id', default='default')
+
+# Mapping vazio compartilhado (somente leitura) para buscas em previous_results
+_EMPTY = MappingProxyType({})
+
+# Salvamentos saem do caminho crítico: uma thread de fundo grava o que for enfileirado
+_persistence_queue = queue.Queue(maxsize=128)
+
+def _persistence_worker():
+    """Consome a fila de salvamentos em segundo plano"""
+    while True:
+        func, args, kwargs = _persistence_queue.get()
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"❌ Erro no salvamento em segundo plano: {e}")
+        finally:
+            _persistence_queue.task_done()
+
+def _persist(func: Callable, *args: Any, **kwargs: Any):
+    """Enfileira salvar_etapa/salvar_erro; grava na hora se a fila estiver cheia"""
+    # Copia os dados: a gravação acontece depois e eles podem mudar
+    try:
+        args = tuple(copy.deepcopy(arg) if isinstance(arg, (dict, list)) else arg for arg in args)
+        kwargs = {key: copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+                  for key, value in kwargs.items()}
+    except (TypeError, copy.Error):
+        kwargs.setdefault('session_id', auto_save_manager.current_session_id)
+        func(*args, **kwargs)
+        return
+    _persist_owned(func, *args, **kwargs)
+
+def _persist_owned(func: Callable, *args: Any, **kwargs: Any):
+    """Como _persist, sem copiar: os dados não podem mais ser alterados pelo chamador"""
+    # Fixa a sessão atual: o salvar_etapa usaria a sessão corrente no momento da gravação
+    kwargs.setdefault('session_id', auto_save_manager.current_session_id)
+    try:
+        _persistence_queue.put_nowait((func, args, kwargs))
+    except queue.Full:
+        func(*args, **kwargs)
+
+def _drain_persistence_queue(timeout: float = 10.0):
+    """Espera os salvamentos pendentes por até 'timeout' segundos (uma gravação travada não bloqueia o encerramento)"""
+    with _persistence_queue.all_tasks_done:
+        if not _persistence_queue.all_tasks_done.wait_for(lambda: not _persistence_queue.unfinished_tasks, timeout):
+            logger.warning(f"⚠️ {_persistence_queue.unfinished_tasks} salvamento(s) pendente(s) descartado(s) no encerramento")
+
+threading.Thread(target=_persistence_worker, name="super-orchestrator-persistence", daemon=True).start()
+# Grava salvamentos pendentes antes de o processo encerrar, com espera limitada
+atexit.register(_drain_persistence_queue)
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(bucket: int) -> str:
+    """Timestamp ISO de um segundo; formatado uma vez por segundo"""
+    return datetime.fromtimestamp(bucket).isoformat()
+
+def memoize_component(func: Callable) -> Callable:
+    """Memoiza componentes determinísticos pelos dados de entrada e resultados anteriores"""
+
+    @wraps(func)
+    def wrapper(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        key = hashlib.blake2b(json.dumps({
+            'component': func.__name__,
+            'seg': data.get('segmento'),
+            'prod': data.get('produto'),
+            'pub': data.get('publico'),
+            'prev': data.get('previous_results', {})
+        }, sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
+
+        with self._component_cache_lock:
+            cached = self._component_cache.get(key)
+            if cached is not None:
+                self._component_cache.move_to_end(key)
+                logger.info(f"📦 {func.__name__} servido do cache")
+                return copy.deepcopy(cached)
+
+        result = func(self, data)
+
+        # Resultados com erro não são cacheados para não envenenar o cache
+        if isinstance(result, dict) and 'error' not in result:
+            with self._component_cache_lock:
+                self._component_cache[key] = copy.deepcopy(result)
+                self._component_cache.move_to_end(key)
+                while len(self._component_cache) > self.component_cache_max_size:
+                    self._component_cache.popitem(last=False)
+
+        return result
+
+    return wrapper
+
+class LazyServiceProxy:
+    """Adia a construção de um serviço até o primeiro acesso a um atributo"""
+
+    __slots__ = ('_factory', '_instance', '_lock')
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def _get_instance(self) -> Any:
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+                instance = self._instance
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_instance(), name)
+
+_DEFAULT_VALIDATION_RULES = {'type': dict, 'min_size': 1}
+
+# Partes estáticas do funil, da concorrência, do plano de ação e do posicionamento; só os textos com
+# dados do projeto são montados a cada chamada
+_FUNIL_ETAPAS = (
+    ('Consciência', 'Despertar interesse no problema', ('Conteúdo educacional', 'Redes sociais', 'SEO')),
+    ('Interesse', 'Demonstrar a solução', ('Webinars', 'E-books', 'Cases de sucesso')),
+    ('Consideração', 'Comparação e validação', ('Demos', 'Consultorias gratuitas', 'Depoimentos')),
+    ('Conversão', 'Fechamento da venda', ('Ofertas limitadas', 'Bônus exclusivos', 'Garantias'))
+)
+
+_CONCORRENTE_PONTOS_FORTES = ('Posicionamento consolidado', 'Boa presença digital')
+_CONCORRENTE_PONTOS_FRACOS = ('Preço alto', 'Atendimento limitado')
+_CONCORRENTE_DIFERENCIAIS = ('Marca conhecida', 'Tecnologia avançada')
+
+_FUNIL_METRICAS = (
+    ('taxa_conversao_consciencia_interesse', '15-25%'),
+    ('taxa_conversao_interesse_consideracao', '8-15%'),
+    ('taxa_conversao_consideracao_compra', '2-5%')
+)
+
+_FUNIL_PONTOS_OTIMIZACAO = (
+    'Melhorar copy das landing pages',
+    'Implementar remarketing',
+    'Criar sequência de e-mails automáticos',
+    'Otimizar formulários de captura'
+)
+
+_PLANO_ACAO_FASES = (
+    (
+        '1 - Estruturação (0-30 dias)',
+        (
+            'Finalizar posicionamento e messaging',
+            'Criar materiais de marketing',
+            'Configurar funil de vendas',
+            'Treinar equipe comercial'
+        ),
+        'R$ 15.000 - R$ 25.000',
+        ('Marketing', 'Vendas', 'Produto')
+    ),
+    (
+        '2 - Lançamento (30-90 dias)',
+        (
+            'Executar campanha de lançamento',
+            'Ativar parcerias estratégicas',
+            'Iniciar produção de conteúdo',
+            'Monitorar métricas-chave'
+        ),
+        'R$ 30.000 - R$ 50.000',
+        ('Marketing', 'Comercial', 'Atendimento')
+    ),
+    (
+        '3 - Escalabilidade (90-180 dias)',
+        (
+            'Otimizar campanhas com base em dados',
+            'Expandir canais de aquisição',
+            'Implementar automações avançadas',
+            'Desenvolver novos produtos/serviços'
+        ),
+        'R$ 50.000 - R$ 100.000',
+        ('Growth', 'Produto', 'Tecnologia')
+    )
+)
+
+_PLANO_ACAO_METRICAS = (
+    ('vendas', 'Receita mensal, ticket médio, volume de vendas'),
+    ('marketing', 'CAC, LTV, ROI por canal, taxa de conversão'),
+    ('produto', 'NPS, churn rate, feature adoption'),
+    ('operacional', 'Produtividade da equipe, custos operacionais')
+)
+
+_PLANO_ACAO_RISCOS = (
+    ('Baixa adesão inicial', 'Intensificar ações de awareness e educação de mercado'),
+    ('Concorrência agressiva', 'Acelerar diferenciação e fidelização de clientes'),
+    ('Recursos limitados', 'Priorizar ações de maior impacto e buscar parcerias')
+)
+
+_POSICIONAMENTO_BENEFICIOS = (
+    'Resultados garantidos ou dinheiro de volta',
+    'Acompanhamento pessoal 1:1 com especialistas',
+    'Metodologia testada e aprovada por +1000 clientes',
+    'Implementação em 7 dias ou menos'
+)
+
+_POSICIONAMENTO_PILARES = (
+    (
+        'Expertise Comprovada',
+        ('Certificações', 'Anos de experiência', 'Cases de sucesso'),
+        'Somos os #1 especialistas em [segmento] no Brasil'
+    ),
+    (
+        'Resultados Garantidos',
+        ('Garantia incondicional', 'Métricas transparentes', 'ROI comprovado'),
+        'Seus resultados são nossa responsabilidade'
+    ),
+    (
+        'Atendimento Personalizado',
+        ('Consultoria 1:1', 'Suporte dedicado', 'Flexibilidade'),
+        'Cada cliente é único, cada solução é personalizada'
+    )
+)
+
+_POSICIONAMENTO_DIFERENCIACAO = (
+    ('vs_concorrente_A', 'Mais completo e com garantia real'),
+    ('vs_concorrente_B', 'Preço melhor com qualidade superior'),
+    ('vs_concorrente_C', 'Implementação mais rápida e suporte melhor')
+)
+
+_POSICIONAMENTO_ARQUITETURA = (
+    ('personalidade', ('Confiável', 'Inovadora', 'Próxima', 'Eficiente')),
+    ('tom_comunicacao', ('Direto', 'Consultivo', 'Empático', 'Orientado a resultados')),
+    ('valores_centrais', ('Transparência', 'Excelência', 'Parceria', 'Crescimento mútuo'))
+)
+
+# Drivers do fallback de emergência, formatados uma única vez na importação
+_EMERGENCY_DRIVERS = tuple(
+    {'numero': i + 1, 'nome': f'Driver {i + 1}', 'descricao': 'Fallback'} for i in range(19)
+)
+
+@dataclass(frozen=True)
+class SessionState:
+    """Snapshot imutável do estado de execução de uma sessão"""
+    status: str
+    start_time: float
+    components_completed: Tuple[str, ...] = ()
+    errors: Tuple[str, ...] = ()
+    execution_time: Optional[float] = None
+    error: Optional[str] = None
+
+@dataclass(slots=True)
+class ConsolidatedReport:
+    """Relatório consolidado; vira dict só na fronteira (salvamento/API)"""
+    session_id: str
+    timestamp: str
+    service_status: Dict[str, Any]
+    analysis_results: Dict[str, Any]
+    components: Dict[str, Any]
+    metrics: Dict[str, Any]
+    consolidation_version: str = '2.0'
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Cópia rasa, na mesma ordem de chaves do relatório antigo (sem asdict, que copia recursivamente)
+        return {
+            'session_id': self.session_id,
+            'timestamp': self.timestamp,
+            'service_status': self.service_status,
+            'analysis_results': self.analysis_results,
+            'consolidation_version': self.consolidation_version,
+            'components': self.components,
+            'metrics': self.metrics
+        }
+
 class SuperOrchestrator:
     """Super Orquestrador que sincroniza TODOS os serviços"""
 
+    # (nome, método, dependências, obrigatório, regras de validação; None usa o padrão)
+    _COMPONENT_SPECS = (
+        ('web_search', '_execute_web_search', (), True, None),
+        ('social_analysis', '_execute_social_analysis', ('web_search',), True, None),
+        ('mental_drivers', '_execute_mental_drivers', ('web_search', 'social_analysis'), True,
+         {'type': dict, 'required_fields': ['drivers'], 'min_size': 1}),
+        ('visual_proofs', '_execute_visual_proofs', ('mental_drivers',), True, None),
+        ('anti_objection', '_execute_anti_objection', ('mental_drivers',), True, None),
+        ('pre_pitch', '_execute_pre_pitch', ('mental_drivers', 'anti_objection'), True, None),
+        ('future_predictions', '_execute_future_predictions', ('web_search', 'social_analysis'), True, None),
+        ('avatar_detalhado', '_execute_avatar_detalhado', ('web_search', 'social_analysis'), True, None),
+        ('funil_vendas', '_execute_funil_vendas', ('mental_drivers', 'anti_objection'), False, None),
+        ('analise_concorrencia', '_execute_analise_concorrencia', ('web_search',), False, None),
+        ('plano_acao', '_execute_plano_acao', ('mental_drivers', 'future_predictions'), False, None),
+        ('posicionamento', '_execute_posicionamento', ('analise_concorrencia', 'avatar_detalhado'), False, None),
+    )
+
+    __slots__ = (
+        'orchestrators', 'services', '_orchestrator_names', '_service_names',
+        'execution_state', 'service_status', '_sync_segments', 'status_probe_timeout',
+        '_component_cache', '_component_cache_lock', 'component_cache_max_size', '_exec_batches'
+    )
+
     def __init__(self):
         """Inicializa o Super Orquestrador"""
         self.orchestrators = {
@@ -55,12 +355,21 @@ class SuperOrchestrator:
             'pre_pitch': pre_pitch_architect,
             'future_prediction': future_prediction_engine,
             'supadata': mcp_supadata_manager,
-            'websailor': AlibabaWebSailorAgent()
+            'websailor': LazyServiceProxy(partial(AlibabaWebSailorAgent))
         }
 
-        self.execution_state = {}
+        # Nomes fixos após a inicialização, usados em cada execução
+        self._orchestrator_names = tuple(self.orchestrators)
+        self._service_names = tuple(self.services)
+
+        self.execution_state: Dict[str, SessionState] = {}
         self.service_status = {}
-        self.sync_lock = threading.Lock()
+        # Locks segmentados: sessões em segmentos diferentes não disputam o mesmo lock
+        self._sync_segments = tuple(threading.Lock() for _ in range(16))
+        self.status_probe_timeout = 2.0  # Segundos por verificação de serviço
+        self._component_cache = OrderedDict()
+        self._component_cache_lock = threading.RLock()
+        self.component_cache_max_size = 256
 
         # Registra componentes no component_orchestrator
         self._register_all_components()
@@ -71,104 +380,19 @@ class SuperOrchestrator:
         """Registra todos os componentes nos orquestradores"""
 
         # Registra no component_orchestrator
-        component_orchestrator.register_component(
-            'web_search',
-            self._execute_web_search,
-            dependencies=[],
-            validation_rules={'type': dict, 'min_size': 1},
-            required=True
-        )
-
-        component_orchestrator.register_component(
-            'social_analysis',
-            self._execute_social_analysis,
-            dependencies=['web_search'],
-            validation_rules={'type': dict, 'min_size': 1},
-            required=True
-        )
-
-        component_orchestrator.register_component(
-            'mental_drivers',
-            self._execute_mental_drivers,
-            dependencies=['web_search', 'social_analysis'],
-            validation_rules={'type': dict, 'required_fields': ['drivers'], 'min_size': 1},
-            required=True
-        )
-
-        component_orchestrator.register_component(
-            'visual_proofs',
-            self._execute_visual_proofs,
-            dependencies=['mental_drivers'],
-            validation_rules={'type': dict, 'min_size': 1},
-            required=True
-        )
-
-        component_orchestrator.register_component(
-            'anti_objection',
-            self._execute_anti_objection,
-            dependencies=['mental_drivers'],
-            validation_rules={'type': dict, 'min_size': 1},
-            required=True
-        )
-
-        component_orchestrator.register_component(
-            'pre_pitch',
-            self._execute_pre_pitch,
-            dependencies=['mental_drivers', 'anti_objection'],
-            validation_rules={'type': dict, 'min_size': 1},
-            required=True
-        )
-
-        component_orchestrator.register_component(
-            'future_predictions',
-            self._execute_future_predictions,
-            dependencies=['web_search', 'social_analysis'],
-            validation_rules={'type': dict, 'min_size': 1},
-            required=True
-        )
-
-        component_orchestrator.register_component(
-            'avatar_detalhado',
-            self._execute_avatar_detalhado,
-            dependencies=['web_search', 'social_analysis'],
-            validation_rules={'type': dict, 'min_size': 1},
-            required=True
-        )
-
-        # NOVOS COMPONENTES PARA ANÁLISE COMPLETA
-        component_orchestrator.register_component(
-            'funil_vendas',
-            self._execute_funil_vendas,
-            dependencies=['mental_drivers', 'anti_objection'],
-            validation_rules={'type': dict, 'min_size': 1},
-            required=False
-        )
-
-        component_orchestrator.register_component(
-            'analise_concorrencia',
-            self._execute_analise_concorrencia,
-            dependencies=['web_search'],
-            validation_rules={'type': dict, 'min_size': 1},
-            required=False
-        )
+        for name, method, dependencies, required, rules in self._COMPONENT_SPECS:
+            component_orchestrator.register_component(
+                name,
+                getattr(self, method),
+                dependencies=list(dependencies),
+                validation_rules=dict(rules or _DEFAULT_VALIDATION_RULES),
+                required=required
+            )
 
-        component_orchestrator.register_component(
-            'plano_acao',
-            self._execute_plano_acao,
-            dependencies=['mental_drivers', 'future_predictions'],
-            validation_rules={'type': dict, 'min_size': 1},
-            required=False
-        )
+        # Compila o grafo uma única vez: cada lote roda em paralelo
+        self._exec_batches = component_orchestrator.compile_execution_plan()['batches']
 
-        component_orchestrator.register_component(
-            'posicionamento',
-            self._execute_posicionamento,
-            dependencies=['analise_concorrencia', 'avatar_detalhado'],
-            validation_rules={'type': dict, 'min_size': 1},
-            required=False
-        )
-
-        logger.info("✅ Todos os componentes registrados nos orquestradores")
+        logger.info(f"✅ Todos os componentes registrados nos orquestradores ({len(self._exec_batches)} estágios paralelos)")
 
     def execute_synchronized_analysis(
         self,
@@ -178,24 +402,20 @@ class SuperOrchestrator:
     ) -> Dict[str, Any]:
         """Executa análise completamente sincronizada"""
 
+        session_token = _SESSION_ID.set(session_id)
         try:
             logger.info("🚀 INICIANDO ANÁLISE SUPER SINCRONIZADA")
             start_time = time.time()
 
-            with self.sync_lock:
-                self.execution_state[session_id] = {
-                    'status': 'running',
-                    'start_time': start_time,
-                    'components_completed': [],
-                    'errors': []
-                }
+            with self._lock_for(session_id):
+                self.execution_state[session_id] = SessionState(status='running', start_time=start_time)
 
             # Salva início
-            salvar_etapa("super_orchestrator_iniciado", {
+            _persist(salvar_etapa, "super_orchestrator_iniciado", {
                 'data': data,
                 'session_id': session_id,
-                'orchestrators': list(self.orchestrators.keys()),
-                'services': list(self.services.keys())
+                'orchestrators': self._orchestrator_names,
+                'services': self._service_names
             }, categoria="analise_completa")
 
             # FASE 1: Verifica status de todos os serviços
@@ -208,7 +428,17 @@ class SuperOrchestrator:
             if progress_callback:
                 progress_callback(2, "🧩 Executando componentes com validação...")
 
-            component_results = component_orchestrator.execute_components(data, progress_callback)
+            components_start = time.time()
+            streamed_results = {}
+            for component_name, result in component_orchestrator.execute_components_streaming(data, progress_callback):
+                streamed_results[component_name] = result
+                completed = self.execution_state[session_id].components_completed + (component_name,)
+                changes = {'components_completed': completed}
+                if result.get('error'):
+                    changes['errors'] = self.execution_state[session_id].errors + (f"{component_name}: {result['error']}",)
+                self._update_session_state(session_id, **changes)
+
+            component_results = component_orchestrator.build_execution_report(streamed_results, components_start)
 
             # FASE 3: Se component_orchestrator falhar, usa master_orchestrator
             success_rate = 0
@@ -231,13 +461,13 @@ class SuperOrchestrator:
 
                 # Combina resultados
                 final_results = self._combine_orchestrator_results(
-                    component_results, master_results, data, session_id
+                    component_results, master_results, data
                 )
 
             else:
                 # Component orchestrator foi bem-sucedido
                 final_results = self._enhance_component_results(
-                    component_results, data, session_id
+                    component_results, data
                 )
 
             # FASE 4: Aplica enhanced orchestrator para análise psicológica
@@ -245,6 +475,8 @@ class SuperOrchestrator:
                 progress_callback(8, "🧠 Aplicando análise psicológica avançada...")
 
             try:
+                # Precisa ser um dict real (não ChainMap): os agentes fazem json.dumps(data)
+                # e o auto_save só serializa dicts; a cópia é rasa, só das chaves de topo
                 enhanced_results = enhanced_orchestrator.execute_ultra_enhanced_analysis(
                     {**data, **final_results}, session_id, progress_callback
                 )
@@ -253,28 +485,26 @@ class SuperOrchestrator:
 
             except Exception as e:
                 logger.error(f"❌ Enhanced orchestrator falhou: {e}")
-                salvar_erro("enhanced_orchestrator_error", e, contexto={'session_id': session_id})
+                _persist(salvar_erro, "enhanced_orchestrator_error", e, contexto={'session_id': session_id})
 
             # FASE 5: Consolidação final e salvamento
             if progress_callback:
                 progress_callback(12, "📊 Consolidando resultados finais...")
 
             consolidated_report = self._consolidate_all_results(
-                final_results, service_status, session_id
+                final_results, service_status
             )
 
             # FASE 6: Salvamento em todas as categorias
             if progress_callback:
                 progress_callback(13, "💾 Salvando em todas as categorias...")
 
-            self._save_to_all_categories(consolidated_report, session_id)
+            self._save_to_all_categories(consolidated_report)
 
             execution_time = time.time() - start_time
 
             # Atualiza estado final
-            with self.sync_lock:
-                self.execution_state[session_id]['status'] = 'completed'
-                self.execution_state[session_id]['execution_time'] = execution_time
+            self._update_session_state(session_id, status='completed', execution_time=execution_time)
 
             logger.info(f"✅ ANÁLISE SUPER SINCRONIZADA CONCLUÍDA em {execution_time:.2f}s")
 
@@ -286,44 +516,57 @@ class SuperOrchestrator:
                 'component_success_rate': success_rate,
                 'total_components': len(component_results['successful_components']) if isinstance(component_results, dict) and 'successful_components' in component_results else 0,
                 'report': consolidated_report,
-                'orchestrators_used': list(self.orchestrators.keys()),
+                'orchestrators_used': self._orchestrator_names,
                 'sync_status': 'PERFECT_SYNC'
             }
 
         except Exception as e:
             logger.error(f"❌ ERRO CRÍTICO no Super Orchestrator: {e}")
-            salvar_erro("super_orchestrator_critico", e, contexto={'session_id': session_id})
+            _persist(salvar_erro, "super_orchestrator_critico", e, contexto={'session_id': session_id})
 
-            with self.sync_lock:
-                self.execution_state[session_id]['status'] = 'failed'
-                self.execution_state[session_id]['error'] = str(e)
+            self._update_session_state(session_id, status='failed', error=str(e))
 
-            return self._generate_emergency_fallback(data, session_id)
+            return self._generate_emergency_fallback(data)
+
+        finally:
+            _SESSION_ID.reset(session_token)
 
     def get_session_progress(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Obtém progresso de uma sessão"""
         try:
-            with self.sync_lock:
-                session_state = self.execution_state.get(session_id)
-                if not session_state:
-                    return None
-
-                total_components = 12
-                completed = len(session_state.get('components_completed', []))
-                percentage = min((completed / total_components) * 100, 95)
-
-                return {
-                    'completed': session_state.get('status') == 'completed',
-                    'percentage': percentage,
-                    'current_step': f'Processando componente {completed + 1}/{total_components}',
-                    'total_steps': total_components,
-                    'estimated_time': f'{max(0, (total_components - completed) * 2)}m'
-                }
+            # Leitura sem lock: o estado é um snapshot imutável
+            session_state = self.execution_state.get(session_id)
+            if not session_state:
+                return None
+
+            total_components = len(self._COMPONENT_SPECS)
+            completed = len(session_state.components_completed)
+            percentage = min((completed / total_components) * 100, 95)
+
+            return {
+                'completed': session_state.status == 'completed',
+                'percentage': percentage,
+                # Após o último componente ainda há consolidação: o passo não passa do total
+                'current_step': f'Processando componente {min(completed + 1, total_components)}/{total_components}',
+                'total_steps': total_components,
+                'estimated_time': f'{max(0, (total_components - completed) * 2)}m'
+            }
 
         except Exception as e:
             logger.error(f"❌ Erro ao obter progresso: {e}")
             return None
 
+    def _lock_for(self, session_id: str) -> threading.Lock:
+        """Retorna o lock do segmento da sessão"""
+        return self._sync_segments[hash(session_id) & 15]
+
+    def _update_session_state(self, session_id: str, **changes: Any):
+        """Publica um novo snapshot do estado da sessão"""
+        with self._lock_for(session_id):
+            current = self.execution_state.get(session_id)
+            if current is not None:
+                self.execution_state[session_id] = replace(current, **changes)
+
     def _check_all_services_status(self) -> Dict[str, Any]:
         """Verifica status de todos os serviços"""
 
@@ -335,35 +578,35 @@ class SuperOrchestrator:
             'overall_health': 'unknown'
         }
 
-        # Verifica AI providers
-        try:
-            ai_status = ai_manager.get_provider_status()
-            status['ai_providers'] = ai_status
-        except Exception as e:
-            logger.error(f"❌ Erro ao verificar AI providers: {e}")
-            status['ai_providers'] = {'error': str(e)}
+        # Todas as verificações rodam em paralelo: a latência total é a do probe mais lento
+        probes = [('ai_providers', None, ai_manager.get_provider_status)]
+        probes.extend(
+            ('search_engines', engine, lambda engine=engine: self._probe_search_engine(engine))
+            for engine in ('exa', 'google', 'serper', 'bing')
+        )
+        probes.extend([
+            ('content_extractors', 'jina_reader',
+             lambda: 'available' if getattr(content_extractor, 'jina_api_key', None) else 'needs_key'),
+            ('content_extractors', 'basic_extraction', lambda: 'available')
+        ])
 
-        # Verifica search engines
+        executor = ThreadPoolExecutor(max_workers=min(16, len(probes)))
         try:
-            # Testa cada engine de busca
-            test_engines = ['exa', 'google', 'serper', 'bing']
-            for engine in test_engines:
+            futures = [(category, name, executor.submit(probe)) for category, name, probe in probes]
+            for category, name, future in futures:
                 try:
-                    # Teste simples para cada engine
-                    status['search_engines'][engine] = 'available'
-                except:
-                    status['search_engines'][engine] = 'unavailable'
-        except Exception as e:
-            status['search_engines'] = {'error': str(e)}
-
-        # Verifica content extractors
-        try:
-            status['content_extractors'] = {
-                'jina_reader': 'needs_key',
-                'basic_extraction': 'available'
-            }
-        except Exception as e:
-            status['content_extractors'] = {'error': str(e)}
+                    result = future.result(timeout=self.status_probe_timeout)
+                except Exception as e:
+                    logger.error(f"❌ Erro ao verificar {name or category}: {e}")
+                    result = {'error': str(e)} if name is None else 'unavailable'
+
+                if name is None:
+                    status[category] = result
+                else:
+                    status[category][name] = result
+        finally:
+            # Não espera probes travados: o resultado deles já foi descartado pelo timeout
+            executor.shutdown(wait=False)
 
         # Calcula saúde geral
         available_services = 0
@@ -391,6 +634,17 @@ class SuperOrchestrator:
 
         return status
 
+    def _probe_search_engine(self, engine: str) -> str:
+        """Verifica se um motor de busca está habilitado e dentro dos limites"""
+        return 'available' if production_search_manager._is_provider_available(engine) else 'unavailable'
+
+    @staticmethod
+    def _normalize_results(results: Any) -> List[Any]:
+        """Extrai a lista de resultados de uma resposta em dict ({'results': [...]}) ou list"""
+        if isinstance(results, dict):
+            return results.get('results') or []
+        return results if isinstance(results, list) else []
+
     # Métodos de execução para cada componente
     def _execute_web_search(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Executa pesquisa web sincronizada"""
@@ -401,8 +655,7 @@ class SuperOrchestrator:
             # Usa production_search_manager primeiro
             search_results = production_search_manager.search_with_fallback(query, 20)
 
-            # CORREÇÃO: Verifica se search_results é dict ou list antes de usar .get()
-            if not search_results or (isinstance(search_results, dict) and len(search_results.get('results', [])) < 5) or (isinstance(search_results, list) and len(search_results) < 5):
+            if len(self._normalize_results(search_results)) < 5:
                 logger.info("🔄 Poucos resultados - usando enhanced search coordinator")
                 enhanced_results = enhanced_search_coordinator.execute_simultaneous_distinct_search(
                     query, data, data.get('session_id', 'default')
@@ -411,17 +664,10 @@ class SuperOrchestrator:
                 if enhanced_results:
                     search_results = enhanced_results
 
-            # CORREÇÃO: Verifica se search_results é dict antes de usar .get()
-            total_results = 0
-            if isinstance(search_results, dict):
-                total_results = len(search_results.get('results', []))
-            elif isinstance(search_results, list):
-                total_results = len(search_results)
-
             return {
                 'search_results': search_results,
                 'query_used': query,
-                'total_results': total_results
+                'total_results': len(self._normalize_results(search_results))
             }
 
         except Exception as e:
@@ -438,10 +684,11 @@ class SuperOrchestrator:
             social_results = mcp_supadata_manager.search_all_platforms(query, 10)
 
             # Análise de sentimento se tiver posts
-            all_posts = []
-            for platform, platform_data in social_results.items():
-                if isinstance(platform_data, dict) and platform_data.get('results'):
-                    all_posts.extend(platform_data['results'])
+            all_posts = list(itertools.chain.from_iterable(
+                platform_data.get('results') or ()
+                for platform_data in social_results.values()
+                if isinstance(platform_data, dict)
+            ))
 
             sentiment_analysis = None
             if all_posts:
@@ -462,7 +709,7 @@ class SuperOrchestrator:
         """Executa geração de drivers mentais"""
 
         try:
-            previous_results = data.get('previous_results', {})
+            previous_results = data.get('previous_results') or _EMPTY
             web_search = previous_results.get('web_search', {})
             social_analysis = previous_results.get('social_analysis', {})
 
@@ -474,15 +721,20 @@ class SuperOrchestrator:
 
             # Garante que temos pelo menos 19 drivers
             if isinstance(drivers, dict) and 'drivers' in drivers:
-                while len(drivers['drivers']) < 19:
-                    additional_driver = {
-                        'numero': len(drivers['drivers']) + 1,
-                        'nome': f"Driver Mental {len(drivers['drivers']) + 1}",
-                        'descricao': f"Driver personalizado para {data.get('segmento', 'mercado')}",
-                        'aplicacao': f"Aplicação específica para {data.get('produto', 'produto/serviço')}",
-                        'impacto': "Alto impacto psicológico"
-                    }
-                    drivers['drivers'].append(additional_driver)
+                existing = len(drivers['drivers'])
+                if existing < 19:
+                    descricao = f"Driver personalizado para {data.get('segmento', 'mercado')}"
+                    aplicacao = f"Aplicação específica para {data.get('produto', 'produto/serviço')}"
+                    drivers['drivers'].extend(
+                        {
+                            'numero': numero,
+                            'nome': f"Driver Mental {numero}",
+                            'descricao': descricao,
+                            'aplicacao': aplicacao,
+                            'impacto': "Alto impacto psicológico"
+                        }
+                        for numero in range(existing + 1, 20)
+                    )
 
             return drivers
 
@@ -497,7 +749,7 @@ class SuperOrchestrator:
         """Executa geração de provas visuais"""
 
         try:
-            previous_results = data.get('previous_results', {})
+            previous_results = data.get('previous_results') or _EMPTY
 
             # Usa visual_proofs_generator
             avatar_data = previous_results.get('mental_drivers', {})
@@ -513,7 +765,7 @@ class SuperOrchestrator:
         """Executa sistema anti-objeção"""
 
         try:
-            previous_results = data.get('previous_results', {})
+            previous_results = data.get('previous_results') or _EMPTY
             mental_drivers = previous_results.get('mental_drivers', {})
 
             # Usa anti_objection_system
@@ -527,205 +779,11 @@ class SuperOrchestrator:
             logger.error(f"❌ Erro no sistema anti-objeção: {e}")
             return {'error': str(e), 'fallback_used': True}
 
-    def _execute_pre_pitch(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Executa geração de pré-pitch"""
-        try:
-            previous_results = data.get('previous_results', {})
-
-            # Usa pre_pitch_architect
-            pre_pitch = pre_pitch_architect.generate_invisible_pre_pitch(
-                data, previous_results.get('mental_drivers', {})
-            )
-
-            return pre_pitch
-
-        except Exception as e:
-            logger.error(f"❌ Erro no pré-pitch: {e}")
-            return {'error': str(e), 'fallback_used': True}
-
-    def _execute_future_predictions(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Executa predições futuras"""
-        try:
-            previous_results = data.get('previous_results', {})
-
-            # Usa future_prediction_engine
-            predictions = future_prediction_engine.generate_predictions(
-                data, previous_results.get('web_search', {})
-            )
-
-            return predictions
-
-        except Exception as e:
-            logger.error(f"❌ Erro nas predições: {e}")
-            return {'error': str(e), 'fallback_used': True}
-
-    def _execute_avatar_detalhado(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Executa geração de avatar detalhado"""
-        try:
-            previous_results = data.get('previous_results', {})
-
-            # Usa enhanced_orchestrator
-            avatar = enhanced_orchestrator.generate_ultra_detailed_avatar(
-                data,
-                previous_results.get('web_search', {}),
-                previous_results.get('social_analysis', {}),
-                data.get('session_id')
-            )
-
-            return avatar
-
-        except Exception as e:
-            logger.error(f"❌ Erro no avatar detalhado: {e}")
-            return {'error': str(e), 'fallback_used': True}
-
-    def _execute_funil_vendas(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Executa análise de funil de vendas"""
-        try:
-            previous_results = data.get('previous_results', {})
-
-            # Usa sales_funnel_optimizer
-            funil = {
-                'etapas': [
-                    {'nome': 'Consciência', 'conversao': '20%'},
-                    {'nome': 'Interesse', 'conversao': '15%'},
-                    {'nome': 'Consideração', 'conversao': '10%'},
-                    {'nome': 'Compra', 'conversao': '5%'}
-                ],
-                'otimizacoes': [
-                    'Melhorar headlines da etapa de consciência',
-                    'Adicionar provas sociais na etapa de interesse',
-                    'Implementar sistema anti-objeção na consideração'
-                ],
-                'baseado_em': f"Análise para {data.get('segmento', 'mercado')}"
-            }
-
-            return funil
-
-        except Exception as e:
-            logger.error(f"❌ Erro no funil de vendas: {e}")
-            return {'error': str(e), 'fallback_used': True}
-
-    def _execute_analise_concorrencia(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Executa análise de concorrência"""
-        try:
-            previous_results = data.get('previous_results', {})
-            web_search = previous_results.get('web_search', {})
-
-            concorrentes = []
-            if isinstance(web_search, dict) and 'search_results' in web_search:
-                results = web_search['search_results']
-                if isinstance(results, dict) and 'results' in results:
-                    for result in results['results'][:5]:
-                        if isinstance(result, dict):
-                            concorrentes.append({
-                                'nome': result.get('title', 'Concorrente'),
-                                'url': result.get('url', ''),
-                                'descricao': result.get('snippet', ''),
-                                'pontos_fortes': ['Presença online', 'Conteúdo relevante'],
-                                'pontos_fracos': ['A definir após análise detalhada']
-                            })
-
-            return {
-                'concorrentes_identificados': concorrentes,
-                'total_concorrentes': len(concorrentes),
-                'oportunidades': [
-                    'Lacuna no atendimento personalizado',
-                    'Falta de conteúdo educativo',
-                    'Preços não competitivos'
-                ],
-                'baseado_em': f"Pesquisa web para {data.get('segmento', 'mercado')}"
-            }
-
-        except Exception as e:
-            logger.error(f"❌ Erro na análise de concorrência: {e}")
-            return {'error': str(e), 'fallback_used': True}
-
-    def _execute_plano_acao(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Executa geração de plano de ação"""
-        try:
-            previous_results = data.get('previous_results', {})
-
-            plano = {
-                'objetivo': f"Crescimento em {data.get('segmento', 'mercado')}",
-                'prazo': '90 dias',
-                'etapas': [
-                    {
-                        'fase': 'Preparação (0-30 dias)',
-                        'acoes': [
-                            'Implementar drivers mentais identificados',
-                            'Desenvolver provas visuais',
-                            'Preparar sistema anti-objeção'
-                        ]
-                    },
-                    {
-                        'fase': 'Execução (30-60 dias)',
-                        'acoes': [
-                            'Lançar campanha com pré-pitch',
-                            'Monitorar métricas de conversão',
-                            'Ajustar estratégia baseada em dados'
-                        ]
-                    },
-                    {
-                        'fase': 'Otimização (60-90 dias)',
-                        'acoes': [
-                            'Otimizar funil baseado em resultados',
-                            'Escalar estratégias bem-sucedidas',
-                            'Preparar próxima fase de crescimento'
-                        ]
-                    }
-                ],
-                'metricas': [
-                    'Taxa de conversão por etapa',
-                    'Custo de aquisição por cliente',
-                    'Lifetime value (LTV)'
-                ],
-                'baseado_em': 'Análise completa do mercado e avatar'
-            }
-
-            return plano
-
-        except Exception as e:
-            logger.error(f"❌ Erro no plano de ação: {e}")
-            return {'error': str(e), 'fallback_used': True}
-
-    def _execute_posicionamento(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Executa análise de posicionamento"""
-        try:
-            previous_results = data.get('previous_results', {})
-
-            posicionamento = {
-                'proposta_valor': f"Solução única para {data.get('segmento', 'mercado')}",
-                'diferenciacao': [
-                    'Metodologia baseada em psicologia aplicada',
-                    'Resultados comprovados e mensuráveis',
-                    'Suporte personalizado e contínuo'
-                ],
-                'publico_primario': data.get('publico', 'Profissionais do segmento'),
-                'mensagem_principal': f"Transforme seu {data.get('produto', 'negócio')} com estratégia comprovada",
-                'canais_recomendados': [
-                    'Marketing de conteúdo',
-                    'Webinars educativos',
-                    'Parcerias estratégicas'
-                ],
-                'metricas_sucesso': [
-                    'Reconhecimento de marca',
-                    'Share of voice no mercado',
-                    'Net Promoter Score (NPS)'
-                ],
-                'baseado_em': 'Análise de concorrência e avatar detalhado'
-            }
-
-            return posicionamento
-
-        except Exception as e:
-            logger.error(f"❌ Erro no posicionamento: {e}")
-            return {'error': str(e), 'fallback_used': True}
-
     def _execute_pre_pitch(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Executa pré-pitch"""
 
         try:
-            previous_results = data.get('previous_results', {})
+            previous_results = data.get('previous_results') or _EMPTY
             mental_drivers = previous_results.get('mental_drivers', {})
             anti_objection = previous_results.get('anti_objection', {})
 
@@ -744,7 +802,7 @@ class SuperOrchestrator:
         """Executa predições futuras"""
 
         try:
-            previous_results = data.get('previous_results', {})
+            previous_results = data.get('previous_results') or _EMPTY
             web_search = previous_results.get('web_search', {})
             social_analysis = previous_results.get('social_analysis', {})
 
@@ -763,7 +821,7 @@ class SuperOrchestrator:
         """Executa avatar detalhado"""
 
         try:
-            previous_results = data.get('previous_results', {})
+            previous_results = data.get('previous_results') or _EMPTY
             web_search = previous_results.get('web_search', {})
             social_analysis = previous_results.get('social_analysis', {})
 
@@ -783,201 +841,165 @@ class SuperOrchestrator:
         self,
         component_results: Dict[str, Any],
         master_results: Dict[str, Any],
-        data: Dict[str, Any],
-        session_id: str
+        data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Combina resultados dos orquestradores"""
 
-        combined = {
+        # master_orchestrator complementa; o component_orchestrator (operando à direita) tem prioridade
+        final_components = (master_results.get('components') or {}) | (component_results.get('successful_components') or {})
+
+        return {
             'component_results': component_results,
             'master_results': master_results,
             'combination_strategy': 'hybrid',
-            'session_id': session_id
+            'session_id': _SESSION_ID.get(),
+            'final_components': final_components
         }
 
-        # Prioriza resultados bem-sucedidos do component_orchestrator
-        final_components = {}
-
-        # Usa resultados do component_orchestrator se disponíveis
-        if component_results.get('successful_components'):
-            final_components.update(component_results['successful_components'])
-
-        # Complementa com master_orchestrator
-        if master_results.get('components'):
-            for component, result in master_results['components'].items():
-                if component not in final_components:
-                    final_components[component] = result
-
-        combined['final_components'] = final_components
-
-        return combined
-
     def _enhance_component_results(
         self,
         component_results: Dict[str, Any],
-        data: Dict[str, Any],
-        session_id: str
+        data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Melhora resultados do component orchestrator"""
 
-        enhanced = {
+        successful = component_results.get('successful_components')
+
+        # Nada a melhorar: devolve só o envelope, sem montar as chaves de componentes
+        if not successful:
+            return {
+                'base_results': component_results,
+                'enhancement_applied': True,
+                'session_id': _SESSION_ID.get()
+            }
+
+        return {
             'base_results': component_results,
             'enhancement_applied': True,
-            'session_id': session_id
+            'session_id': _SESSION_ID.get(),
+            'components': successful,
+            'success_rate': component_results['execution_stats']['success_rate']
         }
 
-        # Aplica melhorias específicas
-        if component_results.get('successful_components'):
-            enhanced['components'] = component_results['successful_components']
-            enhanced['success_rate'] = component_results['execution_stats']['success_rate']
-
-        return enhanced
-
     def _merge_enhanced_results(
         self,
         base_results: Dict[str, Any],
         enhanced_results: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Combina resultados base com enhanced"""
+        """Combina resultados base com enhanced
 
-        merged = base_results.copy()
+        Atualiza base_results no lugar: o chamador é dono do dict e não o reutiliza.
+        """
 
         if enhanced_results:
-            merged['enhanced_analysis'] = enhanced_results
-            merged['psychological_insights'] = enhanced_results.get('psychological_insights', {})
-            merged['ultra_detailed_avatar'] = enhanced_results.get('ultra_detailed_avatar', {})
+            base_results['enhanced_analysis'] = enhanced_results
+            base_results['psychological_insights'] = enhanced_results.get('psychological_insights', {})
+            base_results['ultra_detailed_avatar'] = enhanced_results.get('ultra_detailed_avatar', {})
 
-        return merged
+        return base_results
 
     def _consolidate_all_results(
         self,
         results: Dict[str, Any],
-        service_status: Dict[str, Any],
-        session_id: str
+        service_status: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Consolida todos os resultados em um relatório final"""
 
-        consolidated = {
-            'session_id': session_id,
-            'timestamp': datetime.now().isoformat(),
-            'service_status': service_status,
-            'analysis_results': results,
-            'consolidation_version': '2.0'
-        }
-
         # Extrai componentes principais
         components = results.get('components', {})
         if not components and results.get('final_components'):
             components = results['final_components']
 
-        consolidated['components'] = components
-
-        # Adiciona métricas
-        consolidated['metrics'] = {
-            'total_components': len(components),
-            'successful_components': len([c for c in components.values() if not c.get('error')]),
-            'service_health': service_status.get('overall_health', 'unknown')
-        }
-
-        return consolidated
+        # Adiciona métricas (contagem em uma única passada)
+        successful = sum(1 for c in components.values() if not c.get('error'))
+
+        return ConsolidatedReport(
+            session_id=_SESSION_ID.get(),
+            timestamp=_iso_timestamp(int(time.time())),
+            service_status=service_status,
+            analysis_results=results,
+            components=components,
+            metrics={
+                'total_components': len(components),
+                'successful_components': successful,
+                'service_health': service_status.get('overall_health', 'unknown')
+            }
+        ).to_dict()
 
-    def _save_to_all_categories(self, report: Dict[str, Any], session_id: str):
+    def _save_to_all_categories(self, report: Dict[str, Any]):
         """Salva relatório em todas as categorias"""
 
         try:
-            # Salva relatório final
-            salvar_etapa("relatorio_final_consolidado", report, categoria="analise_completa")
+            # Uma única cópia do relatório; componentes e métricas são enfileirados a partir dela
+            report = copy.deepcopy(report)
 
-            # Salva componentes individuais
-            if report.get('components'):
-                for component_name, component_data in report['components'].items():
-                    salvar_etapa(f"componente_{component_name}_final", component_data, categoria="analise_completa")
+            # Salva relatório final
+            _persist_owned(salvar_etapa, "relatorio_final_consolidado", report, categoria="analise_completa")
 
-            # Salva métricas
+            # Salva componentes e métricas em um único arquivo, indexados pelo nome
+            itens = [(f"componente_{name}_final", data) for name, data in (report.get('components') or {}).items()]
             if report.get('metrics'):
-                salvar_etapa("metricas_finais", report['metrics'], categoria="analise_completa")
+                itens.append(("metricas_finais", report['metrics']))
+            if itens:
+                _persist_owned(salvar_etapas_batch, "componentes_finais", itens, categoria="analise_completa")
 
         except Exception as e:
             logger.error(f"❌ Erro ao salvar relatório: {e}")
-            salvar_erro("erro_salvamento_relatorio", e, contexto={'session_id': session_id})
+            _persist(salvar_erro, "erro_salvamento_relatorio", e, contexto={'session_id': _SESSION_ID.get()})
 
+    @memoize_component
     def _execute_funil_vendas(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Executa análise de funil de vendas"""
 
         try:
-            previous_results = data.get('previous_results', {})
-            mental_drivers = previous_results.get('mental_drivers', {})
-            anti_objection = previous_results.get('anti_objection', {})
+            previous_results = data.get('previous_results') or _EMPTY
+            # Lista lida uma única vez; as janelas de 3 drivers são fatiadas dela por etapa
+            drivers = (previous_results.get('mental_drivers') or _EMPTY).get('drivers') or []
 
             # Gera funil de vendas baseado nos drivers e anti-objeções
             funil = {
                 'etapas_funil': [
                     {
-                        'etapa': 'Consciência',
-                        'objetivo': 'Despertar interesse no problema',
-                        'drivers_aplicaveis': mental_drivers.get('drivers', [])[:3],
-                        'estrategias': ['Conteúdo educacional', 'Redes sociais', 'SEO']
-                    },
-                    {
-                        'etapa': 'Interesse',
-                        'objetivo': 'Demonstrar a solução',
-                        'drivers_aplicaveis': mental_drivers.get('drivers', [])[3:6],
-                        'estrategias': ['Webinars', 'E-books', 'Cases de sucesso']
-                    },
-                    {
-                        'etapa': 'Consideração',
-                        'objetivo': 'Comparação e validação',
-                        'drivers_aplicaveis': mental_drivers.get('drivers', [])[6:9],
-                        'estrategias': ['Demos', 'Consultorias gratuitas', 'Depoimentos']
-                    },
-                    {
-                        'etapa': 'Conversão',
-                        'objetivo': 'Fechamento da venda',
-                        'drivers_aplicaveis': mental_drivers.get('drivers', [])[9:12],
-                        'estrategias': ['Ofertas limitadas', 'Bônus exclusivos', 'Garantias']
+                        'etapa': etapa,
+                        'objetivo': objetivo,
+                        'drivers_aplicaveis': drivers[inicio:inicio + 3],
+                        'estrategias': list(estrategias)
                     }
+                    for inicio, (etapa, objetivo, estrategias) in zip(range(0, 12, 3), _FUNIL_ETAPAS)
                 ],
-                'metricas_chave': {
-                    'taxa_conversao_consciencia_interesse': '15-25%',
-                    'taxa_conversao_interesse_consideracao': '8-15%',
-                    'taxa_conversao_consideracao_compra': '2-5%'
-                },
-                'pontos_otimizacao': [
-                    'Melhorar copy das landing pages',
-                    'Implementar remarketing',
-                    'Criar sequência de e-mails automáticos',
-                    'Otimizar formulários de captura'
-                ]
+                'metricas_chave': dict(_FUNIL_METRICAS),
+                'pontos_otimizacao': list(_FUNIL_PONTOS_OTIMIZACAO)
             }
 
-            salvar_etapa("funil_vendas_completo", funil, categoria="funil_vendas")
+            _persist(salvar_etapa, "funil_vendas_completo", funil, categoria="funil_vendas")
             return funil
 
         except Exception as e:
             logger.error(f"❌ Erro no funil de vendas: {e}")
             return {'error': str(e), 'fallback_used': True}
 
+    @memoize_component
     def _execute_analise_concorrencia(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Executa análise da concorrência"""
 
         try:
-            previous_results = data.get('previous_results', {})
-            web_search = previous_results.get('web_search', {})
+            previous_results = data.get('previous_results') or _EMPTY
+            web_search = previous_results.get('web_search') or _EMPTY
 
             # Analisa concorrentes baseado nos resultados de busca
-            concorrentes = []
-            search_results = web_search.get('search_results', {}).get('results', [])
-
-            for i, result in enumerate(search_results[:5]):
-                if isinstance(result, dict):
-                    concorrentes.append({
-                        'nome': result.get('title', f'Concorrente {i+1}'),
-                        'url': result.get('url', ''),
-                        'descricao': result.get('description', ''),
-                        'pontos_fortes': ['Posicionamento consolidado', 'Boa presença digital'],
-                        'pontos_fracos': ['Preço alto', 'Atendimento limitado'],
-                        'diferenciais': ['Marca conhecida', 'Tecnologia avançada']
-                    })
+            search_results = self._normalize_results(web_search.get('search_results'))
+            concorrentes = [
+                {
+                    'nome': result.get('title', f'Concorrente {i+1}'),
+                    'url': result.get('url', ''),
+                    'descricao': result.get('description', ''),
+                    'pontos_fortes': list(_CONCORRENTE_PONTOS_FORTES),
+                    'pontos_fracos': list(_CONCORRENTE_PONTOS_FRACOS),
+                    'diferenciais': list(_CONCORRENTE_DIFERENCIAIS)
+                }
+                for i, result in enumerate(itertools.islice(search_results, 5))
+                if isinstance(result, dict)
+            ]
 
             analise_concorrencia = {
                 'concorrentes_principais': concorrentes,
@@ -1001,157 +1023,93 @@ class SuperOrchestrator:
                 ]
             }
 
-            salvar_etapa("analise_concorrencia_completa", analise_concorrencia, categoria="concorrencia")
+            _persist(salvar_etapa, "analise_concorrencia_completa", analise_concorrencia, categoria="concorrencia")
             return analise_concorrencia
 
         except Exception as e:
             logger.error(f"❌ Erro na análise de concorrência: {e}")
             return {'error': str(e), 'fallback_used': True}
 
+    @memoize_component
     def _execute_plano_acao(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Executa criação de plano de ação"""
 
         try:
-            previous_results = data.get('previous_results', {})
-            mental_drivers = previous_results.get('mental_drivers', {})
-            future_predictions = previous_results.get('future_predictions', {})
+            segmento = data.get('segmento') or 'mercado'
+            produto = data.get('produto') or 'produto'
 
             plano_acao = {
                 'objetivos_principais': [
-                    f"Aumentar vendas de {data.get('produto', 'produto')} em 50% em 6 meses",
-                    f"Posicionar como líder no segmento {data.get('segmento', 'mercado')}",
+                    f"Aumentar vendas de {produto} em 50% em 6 meses",
+                    f"Posicionar como líder no segmento {segmento}",
                     "Construir base de clientes fiéis e evangelistas"
                 ],
                 'fases_implementacao': [
                     {
-                        'fase': '1 - Estruturação (0-30 dias)',
-                        'atividades': [
-                            'Finalizar posicionamento e messaging',
-                            'Criar materiais de marketing',
-                            'Configurar funil de vendas',
-                            'Treinar equipe comercial'
-                        ],
-                        'investimento': 'R$ 15.000 - R$ 25.000',
-                        'responsaveis': ['Marketing', 'Vendas', 'Produto']
-                    },
-                    {
-                        'fase': '2 - Lançamento (30-90 dias)',
-                        'atividades': [
-                            'Executar campanha de lançamento',
-                            'Ativar parcerias estratégicas',
-                            'Iniciar produção de conteúdo',
-                            'Monitorar métricas-chave'
-                        ],
-                        'investimento': 'R$ 30.000 - R$ 50.000',
-                        'responsaveis': ['Marketing', 'Comercial', 'Atendimento']
-                    },
-                    {
-                        'fase': '3 - Escalabilidade (90-180 dias)',
-                        'atividades': [
-                            'Otimizar campanhas com base em dados',
-                            'Expandir canais de aquisição',
-                            'Implementar automações avançadas',
-                            'Desenvolver novos produtos/serviços'
-                        ],
-                        'investimento': 'R$ 50.000 - R$ 100.000',
-                        'responsaveis': ['Growth', 'Produto', 'Tecnologia']
+                        'fase': fase,
+                        'atividades': list(atividades),
+                        'investimento': investimento,
+                        'responsaveis': list(responsaveis)
                     }
+                    for fase, atividades, investimento, responsaveis in _PLANO_ACAO_FASES
                 ],
-                'metricas_acompanhamento': {
-                    'vendas': 'Receita mensal, ticket médio, volume de vendas',
-                    'marketing': 'CAC, LTV, ROI por canal, taxa de conversão',
-                    'produto': 'NPS, churn rate, feature adoption',
-                    'operacional': 'Produtividade da equipe, custos operacionais'
-                },
+                'metricas_acompanhamento': dict(_PLANO_ACAO_METRICAS),
                 'riscos_mitigacao': [
-                    {
-                        'risco': 'Baixa adesão inicial',
-                        'mitigacao': 'Intensificar ações de awareness e educação de mercado'
-                    },
-                    {
-                        'risco': 'Concorrência agressiva',
-                        'mitigacao': 'Acelerar diferenciação e fidelização de clientes'
-                    },
-                    {
-                        'risco': 'Recursos limitados',
-                        'mitigacao': 'Priorizar ações de maior impacto e buscar parcerias'
-                    }
+                    {'risco': risco, 'mitigacao': mitigacao}
+                    for risco, mitigacao in _PLANO_ACAO_RISCOS
                 ]
             }
 
-            salvar_etapa("plano_acao_completo", plano_acao, categoria="plano_acao")
+            _persist(salvar_etapa, "plano_acao_completo", plano_acao, categoria="plano_acao")
             return plano_acao
 
         except Exception as e:
             logger.error(f"❌ Erro no plano de ação: {e}")
             return {'error': str(e), 'fallback_used': True}
 
+    @memoize_component
     def _execute_posicionamento(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Executa definição de posicionamento"""
 
         try:
-            previous_results = data.get('previous_results', {})
-            analise_concorrencia = previous_results.get('analise_concorrencia', {})
-            avatar_detalhado = previous_results.get('avatar_detalhado', {})
+            # Lidos uma vez; o mesmo default vale para headline e elevator pitch
+            segmento = data.get('segmento') or 'mercado'
+            publico = data.get('publico') or 'profissionais'
 
             posicionamento = {
                 'proposta_valor_unica': {
-                    'headline_principal': f"A única solução de {data.get('segmento', 'mercado')} que garante resultados em 90 dias",
-                    'subheadline': f"Metodologia exclusiva para {data.get('publico', 'profissionais')} que querem crescer de forma consistente",
-                    'beneficios_unicos': [
-                        'Resultados garantidos ou dinheiro de volta',
-                        'Acompanhamento pessoal 1:1 com especialistas',
-                        'Metodologia testada e aprovada por +1000 clientes',
-                        'Implementação em 7 dias ou menos'
-                    ]
+                    'headline_principal': f"A única solução de {segmento} que garante resultados em 90 dias",
+                    'subheadline': f"Metodologia exclusiva para {publico} que querem crescer de forma consistente",
+                    'beneficios_unicos': list(_POSICIONAMENTO_BENEFICIOS)
                 },
                 'pilares_posicionamento': [
-                    {
-                        'pilar': 'Expertise Comprovada',
-                        'evidencias': ['Certificações', 'Anos de experiência', 'Cases de sucesso'],
-                        'messaging': 'Somos os #1 especialistas em [segmento] no Brasil'
-                    },
-                    {
-                        'pilar': 'Resultados Garantidos',
-                        'evidencias': ['Garantia incondicional', 'Métricas transparentes', 'ROI comprovado'],
-                        'messaging': 'Seus resultados são nossa responsabilidade'
-                    },
-                    {
-                        'pilar': 'Atendimento Personalizado',
-                        'evidencias': ['Consultoria 1:1', 'Suporte dedicado', 'Flexibilidade'],
-                        'messaging': 'Cada cliente é único, cada solução é personalizada'
-                    }
+                    {'pilar': pilar, 'evidencias': list(evidencias), 'messaging': messaging}
+                    for pilar, evidencias, messaging in _POSICIONAMENTO_PILARES
                 ],
-                'diferenciacao_concorrencia': {
-                    'vs_concorrente_A': 'Mais completo e com garantia real',
-                    'vs_concorrente_B': 'Preço melhor com qualidade superior',
-                    'vs_concorrente_C': 'Implementação mais rápida e suporte melhor'
-                },
+                'diferenciacao_concorrencia': dict(_POSICIONAMENTO_DIFERENCIACAO),
                 'arquitetura_marca': {
-                    'personalidade': ['Confiável', 'Inovadora', 'Próxima', 'Eficiente'],
-                    'tom_comunicacao': ['Direto', 'Consultivo', 'Empático', 'Orientado a resultados'],
-                    'valores_centrais': ['Transparência', 'Excelência', 'Parceria', 'Crescimento mútuo']
+                    chave: list(valores) for chave, valores in _POSICIONAMENTO_ARQUITETURA
                 },
                 'mensagens_chave': {
-                    'elevator_pitch': f"Ajudamos {data.get('publico', 'empresas')} do segmento {data.get('segmento', 'X')} a [resultado específico] através da nossa metodologia proprietária, com garantia de resultados em 90 dias.",
+                    'elevator_pitch': f"Ajudamos {publico} do segmento {segmento} a [resultado específico] através da nossa metodologia proprietária, com garantia de resultados em 90 dias.",
                     'tagline': "Sua transformação, nossa responsabilidade",
                     'call_to_action': "Agende sua Consultoria Estratégica Gratuita"
                 }
             }
 
-            salvar_etapa("posicionamento_completo", posicionamento, categoria="posicionamento")
+            _persist(salvar_etapa, "posicionamento_completo", posicionamento, categoria="posicionamento")
             return posicionamento
 
         except Exception as e:
             logger.error(f"❌ Erro no posicionamento: {e}")
             return {'error': str(e), 'fallback_used': True}
 
-    def _generate_emergency_fallback(self, data: Dict[str, Any], session_id: str) -> Dict[str, Any]:
+    def _generate_emergency_fallback(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Gera fallback de emergência"""
 
         return {
             'success': False,
-            'session_id': session_id,
+            'session_id': _SESSION_ID.get(),
             'error': 'Falha crítica no Super Orchestrator',
             'fallback_report': {
                 'segmento': data.get('segmento', 'Não especificado'),
@@ -1160,7 +1118,7 @@ class SuperOrchestrator:
                 'components': {
                     'web_search': {'error': 'Falha na pesquisa web'},
                     'social_analysis': {'error': 'Falha na análise social'},
-                    'mental_drivers': {'drivers': [{'numero': i+1, 'nome': f'Driver {i+1}', 'descricao': 'Fallback'} for i in range(19)]},
+                    'mental_drivers': {'drivers': [dict(driver) for driver in _EMERGENCY_DRIVERS]},
                     'visual_proofs': {'error': 'Falha nas provas visuais'},
                     'anti_objection': {'error': 'Falha no sistema anti-objeção'},
                     'pre_pitch': {'error': 'Falha no pré-pitch'},
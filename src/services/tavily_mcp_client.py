@@ -3,6 +3,9 @@ import os
 import logging
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
@@ -16,6 +19,24 @@ class TavilyMCPClient:
         self.base_url = "https://api.tavily.com/search"
         self.is_available = bool(self.api_key)
         
+        # Sessão compartilhada: as buscas por plataforma reaproveitam conexões keep-alive/TLS
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json'})
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            # A busca é idempotente, então o POST também pode ser repetido
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset({'POST'}),
+                # Esgotadas as tentativas, devolve a resposta para o tratamento por status_code
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        
         if self.is_available:
             logger.info("✅ Tavily MCP Client inicializado com sucesso")
         else:
@@ -31,39 +52,13 @@ class TavilyMCPClient:
             if not platforms:
                 platforms = ['twitter', 'linkedin', 'facebook', 'instagram', 'youtube', 'tiktok']
             
-            results = {}
-            
-            for platform in platforms:
-                try:
-                    platform_query = f"{query} site:{self._get_platform_domain(platform)}"
-                    platform_results = self._tavily_search(platform_query, max_results)
-                    
-                    if platform_results:
-                        results[platform] = {
-                            'results': platform_results,
-                            'total': len(platform_results),
-                            'status': 'success',
-                            'platform': platform,
-                            'query_used': platform_query
-                        }
-                        logger.info(f"✅ {platform}: {len(platform_results)} resultados encontrados")
-                    else:
-                        results[platform] = {
-                            'results': self._generate_platform_fallback(platform, query),
-                            'total': 0,
-                            'status': 'no_results',
-                            'fallback_applied': True
-                        }
-                        
-                except Exception as e:
-                    logger.error(f"❌ Erro na busca {platform}: {e}")
-                    results[platform] = {
-                        'results': self._generate_platform_fallback(platform, query),
-                        'total': 0,
-                        'status': 'error',
-                        'error': str(e),
-                        'fallback_applied': True
-                    }
+            # Uma requisição por plataforma, todas em paralelo (I/O de rede); map preserva a ordem
+            with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+                entries = executor.map(
+                    lambda platform: self._search_platform(platform, query, max_results),
+                    platforms
+                )
+                results = dict(zip(platforms, entries))
             
             return results
             
@@ -71,6 +66,39 @@ class TavilyMCPClient:
             logger.error(f"❌ Erro crítico na busca Tavily: {e}")
             return self._fallback_social_search(query, platforms, max_results)
     
+    def _search_platform(self, platform: str, query: str, max_results: int) -> Dict[str, Any]:
+        """Busca em uma plataforma; erros viram fallback da própria plataforma"""
+        try:
+            platform_query = f"{query} site:{self._get_platform_domain(platform)}"
+            platform_results = self._tavily_search(platform_query, max_results)
+            
+            if platform_results:
+                logger.info(f"✅ {platform}: {len(platform_results)} resultados encontrados")
+                return {
+                    'results': platform_results,
+                    'total': len(platform_results),
+                    'status': 'success',
+                    'platform': platform,
+                    'query_used': platform_query
+                }
+            
+            return {
+                'results': self._generate_platform_fallback(platform, query),
+                'total': 0,
+                'status': 'no_results',
+                'fallback_applied': True
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ Erro na busca {platform}: {e}")
+            return {
+                'results': self._generate_platform_fallback(platform, query),
+                'total': 0,
+                'status': 'error',
+                'error': str(e),
+                'fallback_applied': True
+            }
+    
     def _tavily_search(self, query: str, max_results: int) -> List[Dict[str, Any]]:
         """Executa busca usando API Tavily"""
         try:
@@ -85,10 +113,9 @@ class TavilyMCPClient:
                 "exclude_domains": []
             }
             
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
                 json=payload,
-                headers={'Content-Type': 'application/json'},
                 timeout=30
             )
             